@@ -12,10 +12,16 @@ Pipeline stages:
 5. Upload to object storage
 """
 import asyncio
+import json
 import logging
+from celery import chain, signature
 from src.core import celery_app, TaskManager
-from src.models import SubTaskConfig, WorkerType
+from src.core.batcher import batching_enabled, submit_gpu_request
 from src.core.config import settings
+from src.utils.storage import get_task_dir_path, load_task_data
+from src.workers import gpu_worker
+from src.workers.cpu_worker import classify_image, encode_result
+from src.workers.io_worker import download_image, upload_result
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -28,7 +34,10 @@ def image_super_resolution_pipeline(
     """
     Complete image super-resolution pipeline.
 
-    This is the main task that orchestrates all subtasks.
+    This is the main task that orchestrates all subtasks. Stages are chained
+    so each one releases its worker on completion and the next stage is
+    dispatched automatically; the pipeline task is replaced by the chain and
+    its ID resolves to the final stage's result.
 
     Args:
         image_url: URL of input image to download
@@ -40,32 +49,44 @@ def image_super_resolution_pipeline(
     task_id = self.request.id
     logger.info(f"Starting super-resolution pipeline for task {task_id}")
 
-    # Stage 1: Download image
-    download_task = SubTaskConfig(
-        name="download_image",
-        worker_type=WorkerType.IO,
-        queue=settings.queue_io,
-        args=[task_id, image_url],
+    # Paths the stages hand over are fixed per task, so stages taking them
+    # are immutable signatures and keep their own retry policy
+    input_path = str(get_task_dir_path(task_id) / "input.jpg")
+
+    pipeline = chain(
+        # Stage 1: Download image
+        download_image.si(task_id, image_url).set(queue=settings.queue_io),
+        # Stage 2: Classify image
+        classify_image.si(task_id, input_path).set(queue=settings.queue_cpu),
+        # Stage 3: Route to the matching GPU model
+        dispatch_gpu_stage.s(task_id, input_path).set(queue=settings.queue_cpu),
+        # Stage 4: Encode result
+        encode_stage.s(task_id).set(queue=settings.queue_cpu),
+        # Stage 5: Upload result
+        upload_result.si(task_id, "result.jpg", upload_url).set(queue=settings.queue_io),
+        # Cleanup and build the pipeline result
+        finalize_stage.s(task_id, image_url).set(queue=settings.queue_io),
     )
+    return self.replace(pipeline)
 
-    from src.workers.io_worker import download_image
-    input_path = download_image.apply_async(
-        args=[task_id, image_url],
-        queue=settings.queue_io,
-    ).get()
 
-    logger.info(f"Downloaded image to {input_path}")
+@celery_app.task(name="super_resolution_dispatch_gpu_stage", bind=True)
+def dispatch_gpu_stage(self, classification: dict, task_id: str, input_path: str):
+    """
+    Hand the classified image over to the GPU stage.
 
-    # Stage 2: Classify image
-    from src.workers.cpu_worker import classify_image
-    classification = classify_image.apply_async(
-        args=[task_id, input_path],
-        queue=settings.queue_cpu,
-    ).get()
+    The task replaces itself with the category-specific GPU task, so the
+    rest of the chain continues from the GPU result. With GPU batching
+    enabled the request is buffered for the batch dispatcher instead.
 
+    Args:
+        classification: Classification result (previous stage result)
+        task_id: Pipeline task ID
+        input_path: Path to downloaded image
+    """
     logger.info(f"Image classified as: {classification}")
 
-    # Stage 3: Run GPU inference based on classification
+    # Run GPU inference based on classification
     category = classification["category"]
     gpu_queue_map = {
         "general": settings.queue_gpu_general,
@@ -73,41 +94,67 @@ def image_super_resolution_pipeline(
         "landscape": settings.queue_gpu_landscape,
     }
     gpu_task_map = {
-        "general": "gpu_inference_general",
-        "portrait": "gpu_inference_portrait",
-        "landscape": "gpu_inference_landscape",
+        "general": gpu_worker.gpu_inference_general,
+        "portrait": gpu_worker.gpu_inference_portrait,
+        "landscape": gpu_worker.gpu_inference_landscape,
     }
 
     gpu_queue = gpu_queue_map.get(category, settings.queue_gpu_general)
-    gpu_task_name = gpu_task_map.get(category, "gpu_inference_general")
+    gpu_task = gpu_task_map.get(category, gpu_worker.gpu_inference_general)
+
+    if batching_enabled():
+        # Buffer the request for batched inference; the batch task applies
+        # the rest of the chain once this image's output is ready
+        remaining = [signature(t, app=celery_app) for t in reversed(self.request.chain or [])]
+        self.request.chain = None
+        submit_gpu_request(
+            category if category in gpu_task_map else "general",
+            task_id,
+            input_path,
+            callback=chain(*remaining) if remaining else None,
+        )
+        return input_path
+
+    return self.replace(gpu_task.si(task_id, input_path).set(queue=gpu_queue))
 
-    from src.workers import gpu_worker
-    gpu_task = getattr(gpu_worker, gpu_task_name)
-    output_path = gpu_task.apply_async(
-        args=[task_id, input_path],
-        queue=gpu_queue,
-    ).get()
 
+@celery_app.task(name="super_resolution_encode_stage")
+def encode_stage(output_path: str, task_id: str) -> str:
+    """
+    Encode the GPU output.
+
+    Args:
+        output_path: Path to GPU output image (previous stage result)
+        task_id: Pipeline task ID
+
+    Returns:
+        Path to encoded image
+    """
     logger.info(f"GPU inference complete: {output_path}")
 
-    # Stage 4: Encode result
-    from src.workers.cpu_worker import encode_result
-    encoded_path = encode_result.apply_async(
-        args=[task_id, output_path],
-        queue=settings.queue_cpu,
-    ).get()
+    encoded_path = encode_result(task_id, output_path)
 
     logger.info(f"Result encoded: {encoded_path}")
+    return encoded_path
 
-    # Stage 5: Upload result
-    from src.workers.io_worker import upload_result
-    final_url = upload_result.apply_async(
-        args=[task_id, "result.jpg", upload_url],
-        queue=settings.queue_io,
-    ).get()
 
+@celery_app.task(name="super_resolution_finalize_stage")
+def finalize_stage(final_url: str, task_id: str, image_url: str) -> dict:
+    """
+    Cleanup task resources and build the pipeline result.
+
+    Args:
+        final_url: Uploaded result URL (previous stage result)
+        task_id: Pipeline task ID
+        image_url: URL of input image
+
+    Returns:
+        Result dictionary with output URL
+    """
     logger.info(f"Result uploaded to: {final_url}")
 
+    classification = json.loads(load_task_data(task_id, "classification.json"))
+
     # Cleanup task directory
     TaskManager.cleanup_task(task_id)
 
@@ -152,10 +199,12 @@ async def submit_super_resolution_task(
         logger.info(f"Submitted task: {task_id}")
 
         if not sync:
-            # Poll for completion
+            # Long-poll for completion (server waits up to 30s per request)
             while True:
                 status_response = await client.get(
-                    f"http://localhost:8000/api/v1/tasks/{task_id}"
+                    f"http://localhost:8000/api/v1/tasks/{task_id}",
+                    params={"wait": 30},
+                    timeout=40.0,
                 )
                 status = status_response.json()
 
@@ -164,8 +213,6 @@ async def submit_super_resolution_task(
                 if status["state"] in ["SUCCESS", "FAILURE", "TIMEOUT"]:
                     return status
 
-                await asyncio.sleep(1)
-
         return result
 
 
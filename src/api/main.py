@@ -1,11 +1,12 @@
 """FastAPI application for task submission and monitoring."""
+import asyncio
 import logging
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from typing import Dict
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from src.core import TaskManager, settings
 from src.models import TaskRequest, TaskResponse, TaskStatus, TaskState
-from src.monitoring.dashboard import dashboard_app
 
 logger = logging.getLogger(__name__)
 
@@ -35,28 +36,28 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Mount dashboard app
-app.mount("/dashboard", dashboard_app)
+# Mount dashboard app (imported here so only the API process loads it)
+if settings.enable_dashboard:
+    from src.monitoring.dashboard import dashboard_app
+
+    app.mount("/dashboard", dashboard_app)
 
 
 @app.post("/api/v1/tasks", response_model=TaskResponse)
-async def submit_task(
-    request: TaskRequest,
-    background_tasks: BackgroundTasks,
-):
+async def submit_task(request: TaskRequest):
     """
     Submit a new task for processing.
 
     Args:
         request: Task submission request
-        background_tasks: FastAPI background tasks
 
     Returns:
         Task response with task ID
     """
     try:
-        # Submit task
-        task_id = TaskManager.submit_task(
+        # Submit task (broker and backend I/O run off the event loop)
+        task_id = await asyncio.to_thread(
+            TaskManager.submit_task,
             task_name=request.task_name,
             args=request.args,
             kwargs=request.kwargs,
@@ -65,13 +66,13 @@ async def submit_task(
 
         # If sync mode, wait for completion
         if request.sync:
-            status = TaskManager.wait_for_task(
+            status = await TaskManager.wait_for_task_async(
                 task_id=task_id,
                 timeout=settings.task_default_timeout,
+                task_name=request.task_name,
             )
 
-            # Schedule cleanup
-            background_tasks.add_task(TaskManager.cleanup_task, task_id)
+            # Task files are removed by the periodic cleanup_old_tasks sweep
 
             return TaskResponse(
                 task_id=task_id,
@@ -90,26 +91,32 @@ async def submit_task(
 
 
 @app.get("/api/v1/tasks/{task_id}", response_model=TaskStatus)
-async def get_task_status(task_id: str):
+async def get_task_status(
+    task_id: str,
+    wait: int = Query(0, ge=0, le=60),
+):
     """
     Get status of a task.
 
     Args:
         task_id: Task ID
+        wait: Long-poll for up to this many seconds until the task finishes
 
     Returns:
         Task status
     """
     try:
-        status = TaskManager.get_task_status(task_id)
-        return status
+        if wait > 0:
+            return await TaskManager.long_poll_task_status(task_id, wait)
+
+        return await asyncio.to_thread(TaskManager.get_task_status, task_id)
     except Exception as e:
         logger.error(f"Failed to get task status: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.delete("/api/v1/tasks/{task_id}")
-async def cleanup_task(task_id: str):
+async def cleanup_task(task_id: str) -> Dict[str, str]:
     """
     Cleanup task resources.
 
@@ -120,7 +127,7 @@ async def cleanup_task(task_id: str):
         Cleanup confirmation
     """
     try:
-        TaskManager.cleanup_task(task_id)
+        await asyncio.to_thread(TaskManager.cleanup_task, task_id)
         return {"status": "success", "message": f"Task {task_id} cleaned up"}
     except Exception as e:
         logger.error(f"Failed to cleanup task: {e}")
@@ -128,7 +135,7 @@ async def cleanup_task(task_id: str):
 
 
 @app.get("/health")
-async def health():
+async def health() -> Dict[str, str]:
     """Health check endpoint."""
     return {
         "status": "healthy",
@@ -138,7 +145,7 @@ async def health():
 
 
 @app.get("/")
-async def root():
+async def root() -> Dict[str, str]:
     """Root endpoint with API information."""
     return {
         "service": "Task Manager API",
@@ -0,0 +1,111 @@
+"""Opportunistic batching of GPU inference requests."""
+import logging
+import orjson
+from typing import Any, Dict, List, Optional
+from celery import Signature
+from .celery_app import celery_app
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+BATCH_KEY_PREFIX = "gpu-batch:"
+
+# Model name -> GPU queue consuming its batches
+GPU_MODEL_QUEUES = {
+    "general": settings.queue_gpu_general,
+    "portrait": settings.queue_gpu_portrait,
+    "landscape": settings.queue_gpu_landscape,
+}
+
+
+def batching_enabled() -> bool:
+    """Check whether GPU requests should be buffered for batching."""
+    return settings.gpu_max_batch > 1
+
+
+def _redis_client():
+    """Get Redis client of the result backend."""
+    return celery_app.backend.client
+
+
+def batch_queue_key(model_name: str) -> str:
+    """Get Redis list key buffering requests for a model."""
+    return f"{BATCH_KEY_PREFIX}{model_name}"
+
+
+def submit_gpu_request(
+    model_name: str,
+    task_id: str,
+    input_path: str,
+    callback: Optional[Signature] = None,
+):
+    """
+    Buffer a GPU inference request until the next dispatcher run.
+
+    Args:
+        model_name: Name of model to use
+        task_id: Task ID
+        input_path: Path to input image
+        callback: Signature applied with the output path once inference is done
+    """
+    if model_name not in GPU_MODEL_QUEUES:
+        raise ValueError(f"Model {model_name} has no GPU queue")
+
+    item = {
+        "task_id": task_id,
+        "input_path": input_path,
+        "callback": dict(callback) if callback is not None else None,
+    }
+    _redis_client().rpush(batch_queue_key(model_name), orjson.dumps(item))
+
+
+def drain_batch(model_name: str, max_batch: int) -> List[Dict[str, Any]]:
+    """
+    Atomically pop up to max_batch buffered requests for a model.
+
+    Args:
+        model_name: Name of model
+        max_batch: Maximum number of requests to pop
+
+    Returns:
+        List of request items (may be empty)
+    """
+    key = batch_queue_key(model_name)
+    pipe = _redis_client().pipeline(transaction=True)
+    pipe.lrange(key, 0, max_batch - 1)
+    pipe.ltrim(key, max_batch, -1)
+    raw_items, _ = pipe.execute()
+    return [orjson.loads(raw) for raw in raw_items]
+
+
+@celery_app.task(name="dispatch_gpu_batches")
+def dispatch_gpu_batches() -> int:
+    """
+    Submit buffered GPU requests as batched inference tasks.
+
+    Runs periodically (every ``settings.gpu_max_wait_ms``); each model's
+    buffer is drained into as many batches as needed.
+
+    Returns:
+        Number of batches submitted
+    """
+    batches = 0
+
+    for model_name, queue in GPU_MODEL_QUEUES.items():
+        while True:
+            items = drain_batch(model_name, settings.gpu_max_batch)
+            if not items:
+                break
+
+            celery_app.send_task(
+                "gpu_inference_batch",
+                args=[model_name, items],
+                queue=queue,
+            )
+            batches += 1
+            logger.info(f"Dispatched batch of {len(items)} for model {model_name}")
+
+            if len(items) < settings.gpu_max_batch:
+                break
+
+    return batches
@@ -1,26 +1,63 @@
 """Celery application configuration."""
+import gc
+import orjson
 from celery import Celery
-from celery.signals import task_prerun, task_postrun, task_failure
+from celery.signals import (
+    celeryd_init,
+    task_prerun,
+    task_postrun,
+    task_failure,
+    worker_init,
+    worker_process_init,
+    worker_process_shutdown,
+)
+from kombu.serialization import register
 from .config import settings
-from src.monitoring.metrics import task_metrics
+# Module import (not task_metrics) so importing src.monitoring.metrics first
+# does not hit a partially initialized module via src.core
+from src.monitoring import metrics
+
+
+def _orjson_dumps(obj) -> bytes:
+    """Serialize message bodies and results with orjson."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Register orjson serializer (JSON wire format, much faster than stdlib json)
+register(
+    "orjson",
+    _orjson_dumps,
+    orjson.loads,
+    content_type="application/x-orjson",
+    content_encoding="binary",
+)
+
+# Large results are offloaded to shared storage when using Redis
+result_backend = settings.result_backend_url
+if result_backend.startswith(("redis://", "rediss://")):
+    result_backend = f"src.core.result_backend:SharedStorageRedisBackend+{result_backend}"
 
 # Create Celery app
 celery_app = Celery(
     "task_manager",
     broker=settings.broker_url,
-    backend=settings.result_backend_url,
+    backend=result_backend,
     include=[
         "src.workers.io_worker",
         "src.workers.cpu_worker",
         "src.workers.gpu_worker",
+        "src.core.batcher",
+        "src.core.cleanup",
+        "src.monitoring.notification",
     ],
 )
 
 # Configure Celery
 celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    task_serializer="orjson",
+    accept_content=["orjson", "json"],  # json for messages from older producers
+    result_serializer="orjson",
+    result_accept_content=["orjson", "json"],
     timezone="UTC",
     enable_utc=True,
     task_track_started=True,
@@ -32,6 +69,8 @@ celery_app.conf.update(
     task_reject_on_worker_lost=True,  # Requeue tasks if worker dies
     task_default_priority=5,
     broker_connection_retry_on_startup=True,
+    broker_pool_limit=50,  # Reuse broker connections across publishers
+    redis_max_connections=100,  # Shared result backend pool (backend.client)
 )
 
 # Define task routes
@@ -41,26 +80,100 @@ celery_app.conf.task_routes = {
     "src.workers.gpu_worker.gpu_inference_general": {"queue": settings.queue_gpu_general},
     "src.workers.gpu_worker.gpu_inference_portrait": {"queue": settings.queue_gpu_portrait},
     "src.workers.gpu_worker.gpu_inference_landscape": {"queue": settings.queue_gpu_landscape},
+    "dispatch_gpu_batches": {"queue": settings.queue_gpu_dispatch},
+    "cleanup_old_tasks": {"queue": settings.queue_io},
+    "cleanup_task_batch": {"queue": settings.queue_io},
+    "notify_admin": {"queue": settings.queue_notifications},
 }
 
+# Periodic tasks (run with `celery -A src.core.celery_app beat`)
+celery_app.conf.beat_schedule = {
+    "cleanup-old-tasks": {
+        "task": "cleanup_old_tasks",
+        "schedule": float(settings.task_cleanup_interval),
+    },
+}
+
+if settings.gpu_max_batch > 1:
+    celery_app.conf.beat_schedule["dispatch-gpu-batches"] = {
+        "task": "dispatch_gpu_batches",
+        "schedule": settings.gpu_max_wait_ms / 1000.0,
+    }
+
+
+# Worker lifecycle hooks
+@celeryd_init.connect
+def celeryd_init_handler(conf=None, options=None, **kwargs):
+    """
+    Keep GPU pool processes alive instead of recycling them.
+
+    ``worker_max_tasks_per_child`` guards IO and CPU workers against slow
+    leaks, but a recycled GPU process has to reload every model into VRAM
+    before serving again. Workers started with a GPU queue in ``-Q`` run
+    their children without a task limit, unless one is given explicitly
+    with ``--max-tasks-per-child``.
+    """
+    queues = (options or {}).get("queues") or []
+    if isinstance(queues, str):
+        queues = queues.split(",")
+    gpu_queues = {
+        settings.queue_gpu_general,
+        settings.queue_gpu_portrait,
+        settings.queue_gpu_landscape,
+    }
+    if not gpu_queues.isdisjoint(queues):
+        conf.worker_max_tasks_per_child = None
+
+
+@worker_init.connect
+def worker_init_handler(**kwargs):
+    """
+    Freeze the parent's heap before the pool forks children.
+
+    Moving every object allocated so far into the permanent generation keeps
+    the cyclic GC from touching (and so copying) those pages in forked
+    children, preserving copy-on-write sharing. Only modules imported before
+    this point benefit, so heavy C extensions (torch, numpy, PIL) must be
+    imported at module level by the task modules in ``include``.
+    """
+    gc.collect()
+    gc.freeze()
+
+
+@worker_process_init.connect
+def worker_process_init_handler(**kwargs):
+    """Start each pool process with its own HTTP connection pool."""
+    from src.utils.http import reset_http_client
+    reset_http_client()
+
+
+@worker_process_shutdown.connect
+def worker_process_shutdown_handler(**kwargs):
+    """Close pooled HTTP connections when a pool process exits."""
+    from src.utils.http import close_http_client
+    close_http_client()
 
-# Task monitoring hooks
-@task_prerun.connect
-def task_prerun_handler(task_id=None, task=None, **kwargs):
-    """Record task start time."""
-    if settings.enable_metrics:
-        task_metrics.task_started(task_id, task.name)
 
+# Task monitoring hooks (only connected when metrics are enabled, so
+# Celery has no receivers to dispatch to otherwise)
+if settings.enable_metrics:
 
-@task_postrun.connect
-def task_postrun_handler(task_id=None, task=None, retval=None, **kwargs):
-    """Record task completion."""
-    if settings.enable_metrics:
-        task_metrics.task_completed(task_id, task.name, success=True)
+    @task_prerun.connect
+    def task_prerun_handler(task_id=None, task=None, **kwargs):
+        """Record task start time on the task's request context."""
+        task.request.metrics_start_time = metrics.task_metrics.task_started()
 
+    @task_postrun.connect
+    def task_postrun_handler(task_id=None, task=None, retval=None, **kwargs):
+        """Record task completion."""
+        metrics.task_metrics.task_completed(
+            task_id,
+            task.name,
+            success=True,
+            start_time=getattr(task.request, "metrics_start_time", None),
+        )
 
-@task_failure.connect
-def task_failure_handler(task_id=None, exception=None, **kwargs):
-    """Record task failure."""
-    if settings.enable_metrics:
-        task_metrics.task_completed(task_id, "unknown", success=False)
\ No newline at end of file
+    @task_failure.connect
+    def task_failure_handler(task_id=None, exception=None, **kwargs):
+        """Record task failure."""
+        metrics.task_metrics.task_completed(task_id, "unknown", success=False)
@@ -0,0 +1,100 @@
+"""Periodic cleanup of task files on shared storage."""
+import logging
+import os
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import List
+from .celery_app import celery_app
+from .config import settings
+from .result_backend import RESULTS_DIR
+from src.utils.storage import cleanup_task_dir
+
+logger = logging.getLogger(__name__)
+
+CLEANUP_BATCH_SIZE = 100
+
+
+def find_expired_entries(root: Path, max_age: float) -> List[str]:
+    """
+    Find entries of a directory not modified within ``max_age`` seconds.
+
+    Args:
+        root: Directory to scan
+        max_age: Maximum age in seconds
+
+    Returns:
+        List of expired entry paths
+    """
+    if not root.is_dir():
+        return []
+
+    cutoff = time.time() - max_age
+    expired = []
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.name == RESULTS_DIR and root == Path(settings.shared_tmp_path):
+                continue
+            try:
+                if entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                    expired.append(entry.path)
+            except FileNotFoundError:
+                continue
+    return expired
+
+
+@celery_app.task(name="cleanup_old_tasks")
+def cleanup_old_tasks() -> int:
+    """
+    Sweep shared storage for leftovers of finished tasks.
+
+    Task directories are removed once they are older than twice the task
+    timeout. Offloaded result blobs live as long as the backend keeps
+    results (``result_expires``). Removal is dispatched in batches of
+    ``CLEANUP_BATCH_SIZE`` entries.
+
+    Returns:
+        Number of cleanup batches dispatched
+    """
+    root = Path(settings.shared_tmp_path)
+    expired = find_expired_entries(root, settings.task_default_timeout * 2)
+
+    result_expires = celery_app.conf.result_expires
+    if result_expires:
+        if isinstance(result_expires, timedelta):
+            result_expires = result_expires.total_seconds()
+        expired.extend(find_expired_entries(root / RESULTS_DIR, result_expires))
+
+    batches = 0
+    for start in range(0, len(expired), CLEANUP_BATCH_SIZE):
+        cleanup_task_batch.apply_async(
+            args=[expired[start:start + CLEANUP_BATCH_SIZE]],
+            queue=settings.queue_io,
+        )
+        batches += 1
+
+    if expired:
+        logger.info(f"Dispatched cleanup of {len(expired)} entries in {batches} batches")
+    return batches
+
+
+@celery_app.task(name="cleanup_task_batch")
+def cleanup_task_batch(paths: List[str]) -> int:
+    """
+    Remove a batch of task directories or result blobs.
+
+    Args:
+        paths: Paths to remove
+
+    Returns:
+        Number of paths processed
+    """
+    for path in paths:
+        try:
+            if os.path.isdir(path) and not os.path.islink(path):
+                cleanup_task_dir(Path(path))
+            else:
+                Path(path).unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Failed to remove {path}: {e}")
+    return len(paths)
@@ -1,5 +1,7 @@
 """Configuration management."""
-from typing import Optional
+from functools import cached_property
+from typing import Literal, Optional, Tuple
+from pydantic import computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -19,12 +21,26 @@ class Settings(BaseSettings):
     # Task timeout configuration
     task_default_timeout: int = 300  # 5 minutes
     task_queue_timeout: int = 30  # 30 seconds - drop if queued longer
+    task_cleanup_interval: int = 60  # seconds between shared storage sweeps
+
+    # Results larger than this (bytes) are stored on shared storage, not Redis
+    result_inline_threshold: int = 4096
 
     # Worker configuration
     io_worker_concurrency: int = 20
     cpu_worker_concurrency: int = 10
     gpu_worker_concurrency: int = 2  # 2 tasks per GPU
 
+    # GPU batching (disabled when gpu_max_batch <= 1)
+    gpu_max_batch: int = 1  # max requests per batched inference task
+    gpu_max_wait_ms: int = 50  # dispatcher interval
+
+    # PyTorch CUDA allocator for GPU workers (PYTORCH_CUDA_ALLOC_CONF);
+    # an explicit environment variable takes precedence
+    gpu_cuda_alloc_conf: str = "backend:cudaMallocAsync"
+    # Inference precision (half precision runs on tensor cores)
+    gpu_inference_dtype: Literal["float16", "bfloat16", "float32"] = "float16"
+
     # Queue names
     queue_main: str = "main"
     queue_io: str = "io"
@@ -32,12 +48,19 @@ class Settings(BaseSettings):
     queue_gpu_general: str = "gpu-general"
     queue_gpu_portrait: str = "gpu-portrait"
     queue_gpu_landscape: str = "gpu-landscape"
+    queue_notifications: str = "notifications"  # Admin alerts, kept off io
+    queue_gpu_dispatch: str = "gpu-dispatch"  # Batch dispatcher, kept off cpu
 
     # Shared storage
     shared_tmp_path: str = "/tmp/shared/tasks"
 
     # Monitoring
     enable_metrics: bool = True
+    # Histogram buckets (seconds) for task duration and queue time
+    prometheus_latency_buckets: Tuple[float, ...] = (
+        0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+    )
+    enable_dashboard: bool = True  # mount /dashboard on the API app
     metrics_port: int = 9090
 
     # Admin notification
@@ -50,7 +73,8 @@ class Settings(BaseSettings):
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
-    @property
+    @computed_field(repr=False)
+    @cached_property
     def broker_url(self) -> str:
         """Get Celery broker URL."""
         if self.celery_broker_url:
@@ -59,7 +83,8 @@ class Settings(BaseSettings):
         auth = f":{self.redis_password}@" if self.redis_password else ""
         return f"redis://{auth}{self.redis_host}:{self.redis_port}/{self.redis_db}"
 
-    @property
+    @computed_field(repr=False)
+    @cached_property
     def result_backend_url(self) -> str:
         """Get Celery result backend URL."""
         if self.celery_result_backend:
@@ -0,0 +1,89 @@
+"""Historical task durations used to pace result polling."""
+import logging
+from typing import Dict, Optional
+from .celery_app import celery_app
+
+logger = logging.getLogger(__name__)
+
+EWMA_KEY_PREFIX = "task:ewma:"
+EWMA_ALPHA = 0.2  # weight of the newest sample
+
+_task_duration_ewma: Dict[str, float] = {}
+
+
+def _redis_client():
+    """Get Redis client of the result backend, if it has one."""
+    return getattr(celery_app.backend, "client", None)
+
+
+def ewma_key(task_name: str) -> str:
+    """Get Redis key holding the duration EWMA of a task."""
+    return f"{EWMA_KEY_PREFIX}{task_name}"
+
+
+# Fold a sample into the stored EWMA in one round trip, so concurrent
+# writers blend their samples instead of overwriting each other
+_UPDATE_EWMA_SCRIPT = """
+local previous = redis.call('GET', KEYS[1])
+local ewma = tonumber(ARGV[1])
+if previous then
+    ewma = ARGV[2] * ewma + (1 - ARGV[2]) * tonumber(previous)
+end
+redis.call('SET', KEYS[1], ewma)
+return tostring(ewma)
+"""
+
+
+def update_task_duration(task_name: str, duration: float) -> float:
+    """
+    Fold a task duration into the task's EWMA and persist it.
+
+    Args:
+        task_name: Name of the submitted task
+        duration: Time from submission to the final state in seconds
+
+    Returns:
+        Updated EWMA in seconds
+    """
+    previous = _task_duration_ewma.get(task_name)
+    if previous is None:
+        ewma = duration
+    else:
+        ewma = EWMA_ALPHA * duration + (1 - EWMA_ALPHA) * previous
+
+    client = _redis_client()
+    if client is not None:
+        try:
+            ewma = float(
+                client.eval(_UPDATE_EWMA_SCRIPT, 1, ewma_key(task_name), duration, EWMA_ALPHA)
+            )
+        except Exception as e:
+            logger.debug(f"Failed to persist duration EWMA for {task_name}: {e}")
+
+    _task_duration_ewma[task_name] = ewma
+    return ewma
+
+
+def get_task_duration(task_name: str) -> Optional[float]:
+    """
+    Get the duration EWMA of a task.
+
+    Reads the value shared through Redis so processes that never ran the
+    task (e.g. API workers) still get a warm estimate.
+
+    Args:
+        task_name: Name of the task
+
+    Returns:
+        EWMA in seconds, or None if the task has no history
+    """
+    client = _redis_client()
+    if client is not None:
+        try:
+            value = client.get(ewma_key(task_name))
+            if value is not None:
+                return float(value)
+        except Exception as e:
+            logger.debug(f"Failed to read duration EWMA for {task_name}: {e}")
+
+    return _task_duration_ewma.get(task_name)
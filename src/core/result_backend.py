@@ -0,0 +1,113 @@
+"""Redis result backend that keeps large results out of Redis."""
+import logging
+import os
+from pathlib import Path
+from celery import states
+from celery.backends.redis import RedisBackend
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+RESULT_REF_KEY = "__ref__"
+RESULTS_DIR = "results"
+
+
+def get_result_blob_path(task_id: str) -> Path:
+    """
+    Get path of the out-of-band result blob for a task.
+
+    Args:
+        task_id: Task ID
+
+    Returns:
+        Path to result blob
+    """
+    return Path(settings.shared_tmp_path) / RESULTS_DIR / f"{task_id}.bin"
+
+
+class SharedStorageRedisBackend(RedisBackend):
+    """
+    Redis backend storing large task results on shared storage.
+
+    Successful results whose serialized size exceeds
+    ``settings.result_inline_threshold`` are written to
+    ``{shared_tmp_path}/results/{task_id}.bin`` and only a
+    ``{"__ref__": path}`` pointer is kept in Redis. The pointer is resolved
+    when the result is read back, so callers see the original value; if the
+    blob is gone the task reads back as FAILURE.
+    """
+
+    def _store_result(self, task_id, result, state,
+                      traceback=None, request=None, **kwargs):
+        threshold = settings.result_inline_threshold
+        if state == states.SUCCESS and threshold > 0:
+            payload = self.encode(result)
+            if len(payload) > threshold:
+                blob_path = get_result_blob_path(task_id)
+                blob_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = blob_path.with_suffix(".tmp")
+                tmp_path.write_bytes(payload)
+                os.replace(tmp_path, blob_path)
+
+                super()._store_result(
+                    task_id, {RESULT_REF_KEY: str(blob_path)}, state,
+                    traceback=traceback, request=request, **kwargs,
+                )
+                return result
+
+        return super()._store_result(
+            task_id, result, state,
+            traceback=traceback, request=request, **kwargs,
+        )
+
+    def store_pending_many(self, task_ids, result):
+        """
+        Store PENDING meta for many new tasks in one round trip.
+
+        Writes the same meta and key as ``store_result``, but the IDs are
+        freshly generated and cannot hold a result yet, so the read of the
+        current state is skipped and all writes share one pipeline.
+
+        Args:
+            task_ids: IDs of tasks about to be published
+            result: Meta result to store (e.g. submission info)
+        """
+        self.ensure(self._set_pending_many, (task_ids, result))
+
+    def _set_pending_many(self, task_ids, result):
+        with self.client.pipeline(transaction=False) as pipe:
+            for task_id in task_ids:
+                meta = self._get_result_meta(
+                    result=result, state=states.PENDING,
+                    traceback=None, request=None,
+                )
+                meta["task_id"] = task_id
+                key = self.get_key_for_task(task_id)
+                value = self.encode(meta)
+                if self.expires:
+                    pipe.setex(key, self.expires, value)
+                else:
+                    pipe.set(key, value)
+                pipe.publish(key, value)
+            pipe.execute()
+
+    def meta_from_decoded(self, meta):
+        meta = super().meta_from_decoded(meta)
+        result = meta.get("result")
+        if (
+            meta.get("status") == states.SUCCESS
+            and isinstance(result, dict)
+            and result.keys() == {RESULT_REF_KEY}
+        ):
+            blob_path = Path(result[RESULT_REF_KEY])
+            try:
+                meta["result"] = self.decode(blob_path.read_bytes())
+            except FileNotFoundError:
+                logger.warning(f"Result blob {blob_path} is missing")
+                meta["status"] = states.FAILURE
+                meta["result"] = FileNotFoundError(
+                    f"Result of task {meta.get('task_id')} was offloaded to "
+                    f"{blob_path}, which no longer exists"
+                )
+                meta["traceback"] = None
+        return meta
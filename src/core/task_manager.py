@@ -1,17 +1,78 @@
 """Task manager for coordinating parent-child tasks."""
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
-from datetime import datetime, timedelta
-from celery import group, chain
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence
+from datetime import datetime, timedelta, timezone
+from celery import group, chain, chord
+from celery.canvas import Signature
+from celery.utils import uuid
+from celery.exceptions import TimeoutError as CeleryTimeoutError
+from celery.backends.base import BaseKeyValueStoreBackend
 from celery.result import AsyncResult, GroupResult
 from .celery_app import celery_app
 from .config import settings
-from src.models import TaskState, TaskStatus, SubTaskConfig
-from src.utils.storage import get_task_dir, cleanup_task_dir
+from .durations import get_task_duration, update_task_duration
+from .result_backend import SharedStorageRedisBackend
+from src.models import TaskState, TaskStatus, SubTaskConfig, TaskRequest
+from src.utils.storage import get_task_dir_path, cleanup_task_dir
 from src.monitoring.notification import notify_admin_timeout
 
 logger = logging.getLogger(__name__)
 
+# Lower bound for the first poll delay seeded from historical durations
+MIN_POLL_INTERVAL = 0.05
+
+# States after which a task will not change anymore
+FINAL_STATES = (
+    TaskState.SUCCESS,
+    TaskState.FAILURE,
+    TaskState.TIMEOUT,
+    TaskState.REVOKED,
+)
+
+
+@lru_cache(maxsize=256)
+def _resolve_task(task_name: str):
+    """
+    Resolve a registered Celery task by name.
+
+    Args:
+        task_name: Name of the task
+
+    Returns:
+        Task object
+
+    Raises:
+        ValueError: If no task is registered under that name
+    """
+    task_func = celery_app.tasks.get(task_name)
+    if not task_func:
+        raise ValueError(f"Task {task_name} not found")
+    return task_func
+
+
+def _record_submission(task_ids: Sequence[str]):
+    """
+    Record the submission time of new tasks as their PENDING meta.
+
+    The epoch timestamp drives the queue timeout check. On the shared
+    storage Redis backend all metas are written in one round trip.
+
+    Args:
+        task_ids: IDs of tasks about to be published
+    """
+    backend = celery_app.backend
+    pending_meta = {"submitted_at": time.time()}
+
+    if isinstance(backend, SharedStorageRedisBackend):
+        backend.store_pending_many(task_ids, pending_meta)
+        return
+
+    for task_id in task_ids:
+        backend.store_result(task_id, pending_meta, TaskState.PENDING.value)
+
 
 class TaskManager:
     """Manages parent-child task relationships and coordination."""
@@ -19,7 +80,7 @@ class TaskManager:
     @staticmethod
     def submit_task(
         task_name: str,
-        args: List[Any] = None,
+        args: Sequence[Any] = None,
         kwargs: Dict[str, Any] = None,
         priority: int = 5,
     ) -> str:
@@ -35,29 +96,66 @@ class TaskManager:
         Returns:
             Task ID
         """
-        args = args or []
+        args = args or ()
         kwargs = kwargs or {}
 
         # Get task function
-        task_func = celery_app.tasks.get(task_name)
-        if not task_func:
-            raise ValueError(f"Task {task_name} not found")
+        task_func = _resolve_task(task_name)
+
+        task_id = uuid()
+        _record_submission([task_id])
 
         # Submit task
         result = task_func.apply_async(
             args=args,
             kwargs=kwargs,
             priority=priority,
+            task_id=task_id,
         )
 
         logger.info(f"Submitted task {task_name} with ID {result.id}")
         return result.id
 
+    @staticmethod
+    def submit_tasks(requests: Sequence[TaskRequest]) -> List[str]:
+        """
+        Submit several main tasks at once.
+
+        Submission times are written in a single backend round-trip and all
+        messages are published through one pooled producer, instead of one
+        backend write and one broker checkout per task.
+
+        Args:
+            requests: Task submission requests
+
+        Returns:
+            Task IDs, in the order of ``requests``
+        """
+        task_funcs = [_resolve_task(request.task_name) for request in requests]
+        task_ids = [uuid() for _ in requests]
+
+        _record_submission(task_ids)
+
+        # Submit tasks
+        with celery_app.producer_or_acquire() as producer:
+            for request, task_func, task_id in zip(requests, task_funcs, task_ids):
+                task_func.apply_async(
+                    args=request.args,
+                    kwargs=request.kwargs,
+                    priority=request.priority,
+                    task_id=task_id,
+                    producer=producer,
+                )
+
+        logger.info(f"Submitted {len(task_ids)} tasks: {task_ids}")
+        return task_ids
+
     @staticmethod
     def submit_subtasks(
         parent_task_id: str,
         subtask_configs: List[SubTaskConfig],
         parallel: bool = True,
+        callback: Optional[Signature] = None,
     ) -> List[str]:
         """
         Submit subtasks for a parent task.
@@ -66,17 +164,17 @@ class TaskManager:
             parent_task_id: ID of the parent task
             subtask_configs: List of subtask configurations
             parallel: If True, run subtasks in parallel; otherwise sequential
+            callback: Optional signature applied to the subtask results once
+                all subtasks are done (chord body in parallel mode, last
+                link in sequential mode)
 
         Returns:
-            List of subtask IDs
+            List of subtask IDs, or the callback ID when a callback is given
         """
         tasks = []
 
         for config in subtask_configs:
-            task_func = celery_app.tasks.get(config.name)
-            if not task_func:
-                raise ValueError(f"Task {config.name} not found")
-
+            task_func = _resolve_task(config.name)
             signature = task_func.signature(
                 args=config.args,
                 kwargs=config.kwargs,
@@ -87,11 +185,19 @@ class TaskManager:
             tasks.append(signature)
 
         # Execute tasks
-        if parallel:
+        if parallel and callback is not None:
+            # Callback fires from the backend once the whole group is done
+            result = chord(tasks)(callback)
+            # Persist the header so subtask IDs can be restored from its ID
+            result.parent.save()
+            subtask_ids = [result.id]
+        elif parallel:
             job = group(tasks)
             result = job.apply_async()
             subtask_ids = [r.id for r in result.results]
         else:
+            if callback is not None:
+                tasks.append(callback)
             job = chain(tasks)
             result = job.apply_async()
             subtask_ids = [result.id]
@@ -102,45 +208,155 @@ class TaskManager:
         return subtask_ids
 
     @staticmethod
-    def get_task_status(task_id: str) -> TaskStatus:
+    def _build_status(
+        task_id: str,
+        state: TaskState,
+        result: Any = None,
+        error: Optional[str] = None,
+        task_info: Any = None,
+    ) -> TaskStatus:
         """
-        Get status of a task.
+        Build a TaskStatus, applying the queue timeout to PENDING tasks.
 
         Args:
             task_id: Task ID
+            state: Task state reported by the backend
+            result: Task result (successful tasks only)
+            error: Error message (failed tasks only)
+            task_info: Meta stored for the task (submission info when PENDING)
 
         Returns:
             TaskStatus object
         """
-        result = AsyncResult(task_id, app=celery_app)
-
-        status = TaskStatus(
-            task_id=task_id,
-            state=TaskState(result.state),
-            result=result.result if result.successful() else None,
-            error=str(result.info) if result.failed() else None,
-        )
+        submitted_at = None
 
         # Check for timeout
-        if result.state == "PENDING":
+        if state == TaskState.PENDING:
             # Check if task has been waiting too long
-            task_info = result.info
             if isinstance(task_info, dict) and "submitted_at" in task_info:
-                submitted_at = datetime.fromisoformat(task_info["submitted_at"])
-                wait_time = (datetime.utcnow() - submitted_at).total_seconds()
+                submitted_at = task_info["submitted_at"]
+                wait_time = time.time() - submitted_at
 
                 if wait_time > settings.task_queue_timeout:
-                    status.state = TaskState.TIMEOUT
-                    status.error = f"Task timeout after {wait_time:.1f}s in queue"
+                    state = TaskState.TIMEOUT
+                    error = f"Task timeout after {wait_time:.1f}s in queue"
 
                     # Revoke the task
-                    result.revoke(terminate=True)
+                    AsyncResult(task_id, app=celery_app).revoke(terminate=True)
 
                     # Notify admin
                     notify_admin_timeout(task_id, wait_time)
                     logger.warning(f"Task {task_id} timeout after {wait_time:.1f}s")
 
-        return status
+        # Fields come straight from the result backend, skip validation
+        return TaskStatus.model_construct(
+            task_id=task_id,
+            state=state,
+            result=result,
+            error=error,
+            submitted_at=(
+                datetime.fromtimestamp(submitted_at, tz=timezone.utc)
+                if submitted_at is not None
+                else None
+            ),
+        )
+
+    @staticmethod
+    def get_task_status(task_id: str) -> TaskStatus:
+        """
+        Get status of a task.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            TaskStatus object
+        """
+        result = AsyncResult(task_id, app=celery_app)
+
+        return TaskManager._build_status(
+            task_id,
+            TaskState(result.state),
+            result=result.result if result.successful() else None,
+            error=str(result.info) if result.failed() else None,
+            task_info=result.info if result.state == "PENDING" else None,
+        )
+
+    @staticmethod
+    def get_task_statuses(task_ids: List[str]) -> List[TaskStatus]:
+        """
+        Get status of several tasks with a single backend round-trip.
+
+        Args:
+            task_ids: Task IDs
+
+        Returns:
+            TaskStatus objects, in the order of ``task_ids``
+        """
+        backend = celery_app.backend
+        if not isinstance(backend, BaseKeyValueStoreBackend):
+            return [TaskManager.get_task_status(task_id) for task_id in task_ids]
+
+        # One MGET for all tasks; missing keys are tasks not started yet
+        values = backend.mget([backend.get_key_for_task(task_id) for task_id in task_ids])
+
+        statuses = []
+        for task_id, value in zip(task_ids, values):
+            meta = backend.decode_result(value) if value else {}
+            state = TaskState(meta.get("status", TaskState.PENDING))
+            info = meta.get("result")
+            statuses.append(
+                TaskManager._build_status(
+                    task_id,
+                    state,
+                    result=info if state == TaskState.SUCCESS else None,
+                    error=str(info) if state == TaskState.FAILURE else None,
+                    task_info=info,
+                )
+            )
+        return statuses
+
+    @staticmethod
+    async def long_poll_task_status(
+        task_id: str,
+        wait: float,
+        poll_interval: float = 0.1,
+        backoff: float = 1.5,
+        max_interval: float = 1.0,
+    ) -> TaskStatus:
+        """
+        Get status of a task, waiting up to ``wait`` seconds for it to finish.
+
+        Returns as soon as the task reaches a final state, or the current
+        status once ``wait`` has elapsed. The wait itself is an
+        ``asyncio.sleep``; only the individual status reads run in a worker
+        thread, so idle long-polls hold no executor thread.
+
+        Args:
+            task_id: Task ID
+            wait: Maximum time to wait in seconds
+            poll_interval: Initial time between status checks
+            backoff: Multiplier applied to the interval after each check
+            max_interval: Upper bound for the interval
+
+        Returns:
+            TaskStatus object
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + wait
+        interval = poll_interval
+
+        while True:
+            status = await asyncio.to_thread(TaskManager.get_task_status, task_id)
+            if status.state in FINAL_STATES:
+                return status
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return status
+
+            await asyncio.sleep(min(interval, remaining))
+            interval = min(interval * backoff, max_interval)
 
     @staticmethod
     def wait_for_task(
@@ -151,37 +367,111 @@ class TaskManager:
         """
         Wait for a task to complete (for sync API).
 
+        Blocks on the result backend (pub/sub for Redis) instead of sleeping
+        between status checks, so the call returns as soon as the task is
+        done. Waits are chunked by ``settings.task_queue_timeout`` so queued
+        tasks still get their queue timeout check.
+
         Args:
             task_id: Task ID
             timeout: Maximum time to wait in seconds
-            poll_interval: Time between status checks
+            poll_interval: Polling interval for backends without native
+                result notifications
 
         Returns:
             Final TaskStatus
         """
-        import time
-
-        start_time = time.time()
+        result = AsyncResult(task_id, app=celery_app)
+        deadline = time.monotonic() + timeout if timeout else None
 
         while True:
             status = TaskManager.get_task_status(task_id)
 
             # Check if task is done
-            if status.state in [
-                TaskState.SUCCESS,
-                TaskState.FAILURE,
-                TaskState.TIMEOUT,
-                TaskState.REVOKED,
-            ]:
+            if status.state in FINAL_STATES:
                 return status
 
             # Check timeout
-            if timeout and (time.time() - start_time) > timeout:
-                status.state = TaskState.TIMEOUT
-                status.error = "Client timeout"
+            wait = settings.task_queue_timeout
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return status.model_copy(
+                        update={"state": TaskState.TIMEOUT, "error": "Client timeout"}
+                    )
+                wait = min(wait, remaining)
+
+            try:
+                result.get(timeout=wait, propagate=False, interval=poll_interval)
+            except CeleryTimeoutError:
+                pass
+
+    @staticmethod
+    async def wait_for_task_async(
+        task_id: str,
+        timeout: Optional[float] = None,
+        poll_interval: float = 0.5,
+        backoff: float = 1.5,
+        max_interval: float = 10.0,
+        task_name: Optional[str] = None,
+    ) -> TaskStatus:
+        """
+        Wait for a task to complete without blocking the event loop.
+
+        Status checks run in a worker thread and the delay between them
+        grows exponentially up to ``max_interval``. When ``task_name`` has
+        a duration history, the first delay is a quarter of its average
+        duration instead of ``poll_interval``; a successful wait folds the
+        observed submit-to-success time back into that history.
+
+        Args:
+            task_id: Task ID
+            timeout: Maximum time to wait in seconds
+            poll_interval: Initial time between status checks
+            backoff: Multiplier applied to the interval after each check
+            max_interval: Upper bound for the interval
+            task_name: Name of the task, used to seed the interval
+
+        Returns:
+            Final TaskStatus
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + timeout if timeout else None
+        interval = poll_interval
+        track_duration = bool(task_name) and settings.enable_metrics
+
+        if track_duration:
+            ewma = await asyncio.to_thread(get_task_duration, task_name)
+            if ewma is not None:
+                interval = min(max(MIN_POLL_INTERVAL, ewma * 0.25), max_interval)
+
+        while True:
+            status = await asyncio.to_thread(TaskManager.get_task_status, task_id)
+
+            # Check if task is done
+            if status.state in FINAL_STATES:
+                # Only successful runs are representative; the wait starts
+                # right after submission, so this covers the whole pipeline
+                # including replaced stages
+                if track_duration and status.state == TaskState.SUCCESS:
+                    await asyncio.to_thread(
+                        update_task_duration, task_name, loop.time() - started
+                    )
                 return status
 
-            time.sleep(poll_interval)
+            # Check timeout
+            delay = interval
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return status.model_copy(
+                        update={"state": TaskState.TIMEOUT, "error": "Client timeout"}
+                    )
+                delay = min(delay, remaining)
+
+            await asyncio.sleep(delay)
+            interval = min(interval * backoff, max_interval)
 
     @staticmethod
     def cleanup_task(task_id: str):
@@ -192,8 +482,9 @@ class TaskManager:
             task_id: Task ID
         """
         try:
-            task_dir = get_task_dir(task_id)
-            cleanup_task_dir(task_dir)
+            # Plain path: get_task_dir would create a missing directory
+            # just to have it removed again
+            cleanup_task_dir(get_task_dir_path(task_id))
             logger.info(f"Cleaned up resources for task {task_id}")
         except Exception as e:
             logger.error(f"Failed to cleanup task {task_id}: {e}")
\ No newline at end of file
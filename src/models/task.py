@@ -1,8 +1,8 @@
 """Task models and state definitions."""
 from enum import Enum
-from typing import Any, Dict, List, Optional
-from datetime import datetime
-from pydantic import BaseModel, Field
+from typing import Any, Dict, Optional, Tuple
+from datetime import datetime, timezone
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class WorkerType(str, Enum):
@@ -35,26 +35,33 @@ class SubTaskConfig(BaseModel):
     name: str
     worker_type: WorkerType
     queue: str
-    args: List[Any] = Field(default_factory=list)
+    args: Tuple[Any, ...] = ()
     kwargs: Dict[str, Any] = Field(default_factory=dict)
     priority: TaskPriority = TaskPriority.NORMAL
     timeout: Optional[int] = None
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
 
 class TaskRequest(BaseModel):
     """Task submission request."""
     task_name: str
-    args: List[Any] = Field(default_factory=list)
+    args: Tuple[Any, ...] = ()
     kwargs: Dict[str, Any] = Field(default_factory=dict)
     priority: TaskPriority = TaskPriority.NORMAL
     sync: bool = False  # If True, use poll-based sync API
 
+    # Client payload: unknown fields are dropped, as before, not rejected
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
 
 class TaskResponse(BaseModel):
     """Task submission response."""
     task_id: str
     state: TaskState
-    submitted_at: datetime = Field(default_factory=datetime.utcnow)
+    submitted_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 
 class TaskStatus(BaseModel):
@@ -67,7 +74,9 @@ class TaskStatus(BaseModel):
     submitted_at: Optional[datetime] = None
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
-    subtasks: List[str] = Field(default_factory=list)
+    subtasks: Tuple[str, ...] = ()
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 
 class TaskMetrics(BaseModel):
@@ -79,4 +88,6 @@ class TaskMetrics(BaseModel):
     execution_time: float  # seconds executing
     total_time: float  # total end-to-end time
     success: bool
-    timeout: bool = False
\ No newline at end of file
+    timeout: bool = False
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
@@ -1,8 +1,16 @@
 """Prometheus metrics for task monitoring."""
 import logging
 import time
-from typing import Dict
-from prometheus_client import Counter, Histogram, Gauge, generate_latest, REGISTRY
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+from prometheus_client import (
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    ProcessCollector,
+    generate_latest,
+)
 from src.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -13,17 +21,24 @@ class TaskMetrics:
 
     def __init__(self):
         """Initialize metrics."""
+        # Dedicated registry so exports only walk our own collectors instead
+        # of everything imported libraries registered globally
+        self.registry = CollectorRegistry()
+        ProcessCollector(registry=self.registry)
+
         # Task counters
         self.tasks_submitted = Counter(
             "tasks_submitted_total",
             "Total number of tasks submitted",
             ["task_name"],
+            registry=self.registry,
         )
 
         self.tasks_completed = Counter(
             "tasks_completed_total",
             "Total number of tasks completed",
             ["task_name", "status"],
+            registry=self.registry,
         )
 
         # Task timing
@@ -31,12 +46,16 @@ class TaskMetrics:
             "task_duration_seconds",
             "Task execution duration in seconds",
             ["task_name", "worker_type"],
+            buckets=settings.prometheus_latency_buckets,
+            registry=self.registry,
         )
 
         self.task_queue_time = Histogram(
             "task_queue_time_seconds",
             "Time spent in queue before execution",
             ["queue_name"],
+            buckets=settings.prometheus_latency_buckets,
+            registry=self.registry,
         )
 
         # Worker metrics
@@ -44,12 +63,14 @@ class TaskMetrics:
             "active_workers",
             "Number of active workers",
             ["worker_type"],
+            registry=self.registry,
         )
 
         self.queue_depth = Gauge(
             "queue_depth",
             "Number of tasks in queue",
             ["queue_name"],
+            registry=self.registry,
         )
 
         # GPU metrics
@@ -57,6 +78,7 @@ class TaskMetrics:
             "gpu_utilization_percent",
             "GPU utilization percentage",
             ["gpu_id"],
+            registry=self.registry,
         )
 
         # Timeout tracking
@@ -64,49 +86,76 @@ class TaskMetrics:
             "tasks_timeout_total",
             "Total number of tasks that timed out",
             ["task_name"],
+            registry=self.registry,
         )
 
         # Internal tracking
-        self._task_start_times: Dict[str, float] = {}
+        self._label_children: Dict[Tuple[int, Tuple[str, ...]], Any] = {}
+
+    def _child(self, metric, *label_values: str):
+        """
+        Get the labelled child of a metric, caching it for later calls.
+
+        Args:
+            metric: Prometheus metric with labels
+            label_values: Label values in the metric's label order
+
+        Returns:
+            Labelled metric child
+        """
+        key = (id(metric), label_values)
+        child = self._label_children.get(key)
+        if child is None:
+            child = metric.labels(*label_values)
+            self._label_children[key] = child
+        return child
 
     def task_submitted(self, task_name: str):
         """Record task submission."""
-        self.tasks_submitted.labels(task_name=task_name).inc()
-
-    def task_started(self, task_id: str, task_name: str):
-        """Record task start."""
-        self._task_start_times[task_id] = time.time()
+        self._child(self.tasks_submitted, task_name).inc()
 
-    def task_completed(self, task_id: str, task_name: str, success: bool):
+    @staticmethod
+    def task_started() -> float:
+        """
+        Record task start.
+
+        Returns:
+            Start timestamp to pass back to ``task_completed``
+        """
+        return time.monotonic()
+
+    def task_completed(
+        self,
+        task_id: str,
+        task_name: str,
+        success: bool,
+        start_time: Optional[float] = None,
+    ):
         """Record task completion."""
         status = "success" if success else "failure"
-        self.tasks_completed.labels(task_name=task_name, status=status).inc()
+        self._child(self.tasks_completed, task_name, status).inc()
 
         # Record duration
-        if task_id in self._task_start_times:
-            duration = time.time() - self._task_start_times[task_id]
+        if start_time is not None:
+            duration = time.monotonic() - start_time
             # Extract worker type from task name
             worker_type = self._extract_worker_type(task_name)
-            self.task_duration.labels(
-                task_name=task_name,
-                worker_type=worker_type,
-            ).observe(duration)
-
-            del self._task_start_times[task_id]
+            self._child(self.task_duration, task_name, worker_type).observe(duration)
 
     def task_timeout(self, task_name: str):
         """Record task timeout."""
-        self.tasks_timeout.labels(task_name=task_name).inc()
+        self._child(self.tasks_timeout, task_name).inc()
 
     def update_queue_depth(self, queue_name: str, depth: int):
         """Update queue depth metric."""
-        self.queue_depth.labels(queue_name=queue_name).set(depth)
+        self._child(self.queue_depth, queue_name).set(depth)
 
     def update_gpu_utilization(self, gpu_id: str, utilization: float):
         """Update GPU utilization metric."""
-        self.gpu_utilization.labels(gpu_id=gpu_id).set(utilization)
+        self._child(self.gpu_utilization, gpu_id).set(utilization)
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _extract_worker_type(task_name: str) -> str:
         """Extract worker type from task name."""
         if "gpu" in task_name.lower():
@@ -120,7 +169,7 @@ class TaskMetrics:
 
     def export_metrics(self) -> bytes:
         """Export metrics in Prometheus format."""
-        return generate_latest(REGISTRY)
+        return generate_latest(self.registry)
 
 
 # Global metrics instance
@@ -1,16 +1,69 @@
 """Admin notification system for timeouts and failures."""
 import logging
-import httpx
+import threading
+import time
+from collections import OrderedDict
 from typing import Optional
+from celery import shared_task
 from src.core.config import settings
+from src.utils.http import get_http_client
 
 logger = logging.getLogger(__name__)
 
+# Identical alerts for the same task within one window are sent once
+NOTIFY_DEDUP_WINDOW = 60  # seconds
+NOTIFY_DEDUP_MAXSIZE = 1024
+
+_recent_alerts: "OrderedDict[tuple, None]" = OrderedDict()
+_recent_alerts_lock = threading.Lock()
+
+
+def _is_duplicate_alert(event: str, task_id: str) -> bool:
+    """
+    Check whether an alert was already sent in the current window.
+
+    Args:
+        event: Event name
+        task_id: Task ID the alert is about
+
+    Returns:
+        True if the alert should be dropped
+    """
+    key = (event, task_id, int(time.time() // NOTIFY_DEDUP_WINDOW))
+    with _recent_alerts_lock:
+        if key in _recent_alerts:
+            return True
+        _recent_alerts[key] = None
+        if len(_recent_alerts) > NOTIFY_DEDUP_MAXSIZE:
+            _recent_alerts.popitem(last=False)
+    return False
+
+
+def _enqueue_notification(payload: dict, email_subject: Optional[str] = None):
+    """
+    Queue an admin notification for delivery by a worker.
+
+    Args:
+        payload: Webhook payload (must contain ``event`` and ``task_id``)
+        email_subject: Send an email with this subject as well
+    """
+    if not settings.admin_webhook_url and not settings.admin_email:
+        return
+    if _is_duplicate_alert(payload["event"], payload["task_id"]):
+        return
+
+    try:
+        notify_admin.apply_async(args=[payload, email_subject])
+    except Exception as e:
+        logger.error(f"Failed to queue admin notification: {e}")
+
 
 def notify_admin_timeout(task_id: str, wait_time: float):
     """
     Notify admin about task timeout.
 
+    Delivery happens asynchronously in the ``notify_admin`` task.
+
     Args:
         task_id: ID of timed out task
         wait_time: Time spent in queue before timeout
@@ -18,37 +71,23 @@ def notify_admin_timeout(task_id: str, wait_time: float):
     message = f"Task {task_id} timed out after {wait_time:.1f}s in queue"
     logger.warning(message)
 
-    # Send webhook notification if configured
-    if settings.admin_webhook_url:
-        try:
-            _send_webhook(
-                url=settings.admin_webhook_url,
-                payload={
-                    "event": "task_timeout",
-                    "task_id": task_id,
-                    "wait_time": wait_time,
-                    "message": message,
-                },
-            )
-        except Exception as e:
-            logger.error(f"Failed to send webhook notification: {e}")
-
-    # Send email notification if configured
-    if settings.admin_email:
-        try:
-            _send_email(
-                to=settings.admin_email,
-                subject=f"Task Timeout Alert: {task_id}",
-                body=message,
-            )
-        except Exception as e:
-            logger.error(f"Failed to send email notification: {e}")
+    _enqueue_notification(
+        payload={
+            "event": "task_timeout",
+            "task_id": task_id,
+            "wait_time": wait_time,
+            "message": message,
+        },
+        email_subject=f"Task Timeout Alert: {task_id}",
+    )
 
 
 def notify_admin_failure(task_id: str, error: str):
     """
     Notify admin about task failure.
 
+    Delivery happens asynchronously in the ``notify_admin`` task.
+
     Args:
         task_id: ID of failed task
         error: Error message
@@ -56,27 +95,47 @@ def notify_admin_failure(task_id: str, error: str):
     message = f"Task {task_id} failed: {error}"
     logger.error(message)
 
+    _enqueue_notification(
+        payload={
+            "event": "task_failure",
+            "task_id": task_id,
+            "error": error,
+            "message": message,
+        },
+    )
+
+
+@shared_task(name="notify_admin", rate_limit="10/s", ignore_result=True)
+def notify_admin(payload: dict, email_subject: Optional[str] = None):
+    """
+    Deliver an admin notification via webhook and email.
+
+    Args:
+        payload: Webhook payload
+        email_subject: Send an email with this subject as well
+    """
     if settings.admin_webhook_url:
         try:
-            _send_webhook(
-                url=settings.admin_webhook_url,
-                payload={
-                    "event": "task_failure",
-                    "task_id": task_id,
-                    "error": error,
-                    "message": message,
-                },
-            )
+            _send_webhook(url=settings.admin_webhook_url, payload=payload)
         except Exception as e:
             logger.error(f"Failed to send webhook notification: {e}")
 
+    if email_subject and settings.admin_email:
+        try:
+            _send_email(
+                to=settings.admin_email,
+                subject=email_subject,
+                body=payload["message"],
+            )
+        except Exception as e:
+            logger.error(f"Failed to send email notification: {e}")
+
 
 def _send_webhook(url: str, payload: dict):
     """Send webhook notification."""
-    with httpx.Client(timeout=10.0) as client:
-        response = client.post(url, json=payload)
-        response.raise_for_status()
-        logger.info(f"Webhook notification sent to {url}")
+    response = get_http_client().post(url, json=payload, timeout=10.0)
+    response.raise_for_status()
+    logger.info(f"Webhook notification sent to {url}")
 
 
 def _send_email(to: str, subject: str, body: str):
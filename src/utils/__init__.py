@@ -1,16 +1,22 @@
 """Utility functions."""
 from .storage import (
     get_task_dir,
+    get_task_dir_path,
     get_task_file_path,
     cleanup_task_dir,
+    atomic_task_file,
+    open_task_file,
     save_task_data,
     load_task_data,
 )
 
 __all__ = [
     "get_task_dir",
+    "get_task_dir_path",
     "get_task_file_path",
     "cleanup_task_dir",
+    "atomic_task_file",
+    "open_task_file",
     "save_task_data",
     "load_task_data",
 ]
\ No newline at end of file
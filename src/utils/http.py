@@ -0,0 +1,43 @@
+"""Shared HTTP client for outbound requests."""
+from typing import Optional
+import httpx
+
+HTTP_TIMEOUT = 30.0
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=64, max_connections=128)
+
+_HTTP_CLIENT: Optional[httpx.Client] = None
+
+
+def get_http_client() -> httpx.Client:
+    """
+    Get the process-wide HTTP client, creating it on first use.
+
+    Reusing one client keeps connections alive between calls, so repeated
+    requests to the same host skip the TCP and TLS handshakes.
+
+    Returns:
+        Shared httpx client
+    """
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        _HTTP_CLIENT = httpx.Client(timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS)
+    return _HTTP_CLIENT
+
+
+def reset_http_client():
+    """
+    Drop the client inherited from a parent process without closing it.
+
+    Pooled sockets are shared with the parent after a fork, so the child
+    must not close them; it simply starts a fresh pool on next use.
+    """
+    global _HTTP_CLIENT
+    _HTTP_CLIENT = None
+
+
+def close_http_client():
+    """Close the process-wide HTTP client and its pooled connections."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is not None:
+        _HTTP_CLIENT.close()
+        _HTTP_CLIENT = None
@@ -1,23 +1,49 @@
 """Shared storage utilities for task data."""
 import os
 import shutil
+from functools import lru_cache
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
+from typing import BinaryIO, Iterator
 from src.core.config import settings
 
 
+@lru_cache(maxsize=4096)
+def _ensure_task_dir(root: str, task_id: str) -> Path:
+    """Create a task directory once per process and remember it."""
+    task_dir = Path(root) / task_id
+    task_dir.mkdir(parents=True, exist_ok=True)
+    return task_dir
+
+
+def get_task_dir_path(task_id: str) -> Path:
+    """
+    Get task-specific directory path without creating it.
+
+    Args:
+        task_id: Task ID
+
+    Returns:
+        Path to task directory
+    """
+    return Path(settings.shared_tmp_path) / task_id
+
+
 def get_task_dir(task_id: str) -> Path:
     """
     Get task-specific directory path.
 
+    The directory is created on first use; later calls in the same process
+    return the cached path without another ``mkdir``.
+
     Args:
         task_id: Task ID
 
     Returns:
         Path to task directory
     """
-    task_dir = Path(settings.shared_tmp_path) / task_id
-    task_dir.mkdir(parents=True, exist_ok=True)
-    return task_dir
+    return _ensure_task_dir(settings.shared_tmp_path, task_id)
 
 
 def get_task_file_path(task_id: str, filename: str) -> Path:
@@ -38,25 +64,101 @@ def cleanup_task_dir(task_dir: Path):
     """
     Remove task directory and all contents.
 
+    Task directories hold a handful of flat files, so they are unlinked
+    directly; only nested subdirectories go through ``shutil.rmtree``.
+
     Args:
         task_dir: Path to task directory
     """
-    if task_dir.exists():
-        shutil.rmtree(task_dir)
+    try:
+        with os.scandir(task_dir) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+        os.rmdir(task_dir)
+    except FileNotFoundError:
+        pass
+
+
+def open_task_file(file_path: Path, mode: str = "wb") -> BinaryIO:
+    """
+    Open a file in a task directory for writing.
+
+    Task directories are only created once per process, so the cached one
+    may have been removed since (e.g. by cleanup in another process); the
+    directory is then recreated and the open retried.
+
+    Args:
+        file_path: Path to file within a task directory
+        mode: File mode
+
+    Returns:
+        Open file object
+    """
+    try:
+        return open(file_path, mode)
+    except FileNotFoundError:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        return open(file_path, mode)
+
+
+@contextmanager
+def atomic_task_file(file_path: Path) -> Iterator[BinaryIO]:
+    """
+    Write a file in a task directory atomically.
+
+    Data goes to a unique temporary file next to ``file_path``, which is
+    renamed into place once the block exits cleanly and removed if it
+    raises. Concurrent writers of the same file (e.g. a redelivered task
+    while the original still runs) never share a temporary file.
+
+    Args:
+        file_path: Path to file within a task directory
+
+    Yields:
+        Open file object of the temporary file
+    """
+    prefix = f".{file_path.name}."
+    try:
+        fd, tmp_name = tempfile.mkstemp(dir=file_path.parent, prefix=prefix)
+    except FileNotFoundError:
+        # Cached task directory removed since (see open_task_file)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=file_path.parent, prefix=prefix)
+
+    try:
+        # mkstemp creates 0600 files; other workers must be able to read them
+        os.fchmod(fd, 0o644)
+        with os.fdopen(fd, "wb") as f:
+            yield f
+        os.replace(tmp_name, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
 
 
 def save_task_data(task_id: str, filename: str, data: bytes):
     """
     Save binary data to task directory.
 
+    The data is written to a temporary file and renamed into place, so
+    readers on shared storage never see a truncated file.
+
     Args:
         task_id: Task ID
         filename: Name of file to save
         data: Binary data to write
     """
     file_path = get_task_file_path(task_id, filename)
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-    file_path.write_bytes(data)
+    if Path(filename).parent != Path("."):
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+    with atomic_task_file(file_path) as f:
+        f.write(data)
 
 
 def load_task_data(task_id: str, filename: str) -> bytes:
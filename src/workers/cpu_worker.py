@@ -1,13 +1,18 @@
 """CPU-bound workers for classification and encoding."""
 import logging
-import json
+import orjson
 from enum import Enum
-from PIL import Image
+from PIL import Image, features
 from src.core.celery_app import celery_app
-from src.utils.storage import get_task_file_path, save_task_data
+from src.utils.storage import get_task_file_path, open_task_file, save_task_data
 
 logger = logging.getLogger(__name__)
 
+# Pillow wheels bundle libjpeg-turbo; builds against plain libjpeg encode
+# JPEGs several times slower
+if not features.check_feature("libjpeg_turbo"):
+    logger.warning("Pillow is built without libjpeg-turbo, JPEG encoding will be slow")
+
 
 class ImageCategory(str, Enum):
     """Image category classification."""
@@ -16,6 +21,34 @@ class ImageCategory(str, Enum):
     LANDSCAPE = "landscape"
 
 
+# Plain string values, so the hot path skips enum attribute lookups
+_CATEGORY_GENERAL = ImageCategory.GENERAL.value
+_CATEGORY_PORTRAIT = ImageCategory.PORTRAIT.value
+_CATEGORY_LANDSCAPE = ImageCategory.LANDSCAPE.value
+
+
+def _category_for_aspect_ratio(aspect_ratio: float) -> str:
+    """
+    Map an aspect ratio to an image category value.
+
+    Args:
+        aspect_ratio: Width divided by height
+
+    Returns:
+        Category value (see ``ImageCategory``)
+    """
+    # Simple classification logic (placeholder - replace with actual model)
+    # In production, use a lightweight classification model
+    if 0.7 <= aspect_ratio <= 1.3:
+        # Nearly square - likely portrait
+        return _CATEGORY_PORTRAIT
+    if aspect_ratio > 1.5:
+        # Wide aspect ratio - likely landscape
+        return _CATEGORY_LANDSCAPE
+    # Default to general model
+    return _CATEGORY_GENERAL
+
+
 @celery_app.task(name="classify_image", bind=True)
 def classify_image(self, task_id: str, image_path: str) -> dict:
     """
@@ -31,35 +64,25 @@ def classify_image(self, task_id: str, image_path: str) -> dict:
     try:
         logger.info(f"Classifying image for task {task_id}")
 
-        # Load image
-        image = Image.open(image_path)
-        width, height = image.size
+        # Image.open only parses the header; size must not trigger a decode,
+        # so never call load()/convert() here
+        with Image.open(image_path) as image:
+            width, height = image.size
         aspect_ratio = width / height
 
-        # Simple classification logic (placeholder - replace with actual model)
-        # In production, use a lightweight classification model
-        if 0.7 <= aspect_ratio <= 1.3:
-            # Nearly square - likely portrait
-            category = ImageCategory.PORTRAIT
-        elif aspect_ratio > 1.5:
-            # Wide aspect ratio - likely landscape
-            category = ImageCategory.LANDSCAPE
-        else:
-            # Default to general model
-            category = ImageCategory.GENERAL
+        category = _category_for_aspect_ratio(aspect_ratio)
 
         result = {
-            "category": category.value,
+            "category": category,
             "width": width,
             "height": height,
             "aspect_ratio": aspect_ratio,
         }
 
         # Save classification result
-        result_json = json.dumps(result)
-        save_task_data(task_id, "classification.json", result_json.encode())
+        save_task_data(task_id, "classification.json", orjson.dumps(result))
 
-        logger.info(f"Classified as {category.value}: {result}")
+        logger.info(f"Classified as {category}: {result}")
         return result
 
     except Exception as exc:
@@ -83,17 +106,20 @@ def encode_result(self, task_id: str, output_path: str, quality: int = 95) -> st
     try:
         logger.info(f"Encoding result for task {task_id}")
 
-        # Load and optimize image
-        image = Image.open(output_path)
-
-        # Save optimized version
         encoded_path = get_task_file_path(task_id, "result.jpg")
-        image.save(
-            encoded_path,
-            "JPEG",
-            quality=quality,
-            optimize=True,
-        )
+
+        # Pillow's bundled libjpeg-turbo does the encode; the extra Huffman
+        # optimization pass (optimize=True) is skipped as it roughly doubles
+        # encode time for a few percent smaller files. Baseline 4:2:0 is
+        # turbo's fastest path, so keep it explicit
+        with Image.open(output_path) as image, open_task_file(encoded_path) as f:
+            image.save(
+                f,
+                "JPEG",
+                quality=quality,
+                subsampling=2,
+                progressive=False,
+            )
 
         logger.info(f"Encoded result to {encoded_path}")
         return str(encoded_path)
@@ -1,19 +1,39 @@
 """GPU workers for model inference with model preloading."""
 import logging
 import os
-from typing import Dict, Any, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Optional
 from PIL import Image
+from celery import concurrency, signature
+from celery.canvas import maybe_signature
+from celery.concurrency.prefork import TaskPool as PreforkPool
+from celery.signals import worker_init, worker_process_init
 from src.core.celery_app import celery_app
 from src.core.config import settings
-from src.utils.storage import get_task_file_path
+from src.utils.storage import get_task_file_path, open_task_file
 
 logger = logging.getLogger(__name__)
 
+# Pool CUDA allocations instead of a cudaMalloc/cudaFree per inference.
+# Must be set before torch initializes CUDA.
+os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", settings.gpu_cuda_alloc_conf)
+
+# Models preloaded on worker startup (1GB each, fits in 24GB VRAM)
+MODEL_PATHS = {
+    "general": "/models/general_model.pth",
+    "portrait": "/models/portrait_model.pth",
+    "landscape": "/models/landscape_model.pth",
+}
+
 
 class ModelRegistry:
     """Registry for preloaded models."""
 
     _models: Dict[str, Any] = {}
+    _lock = threading.Lock()
+    _model_locks: Dict[str, threading.Lock] = {}
 
     @classmethod
     def load_model(cls, model_name: str, model_path: str) -> Any:
@@ -27,23 +47,43 @@ class ModelRegistry:
         Returns:
             Loaded model object
         """
-        if model_name not in cls._models:
-            logger.info(f"Loading model {model_name} from {model_path}")
-
-            # Placeholder for actual model loading
-            # In production, replace with actual model loading code:
-            # model = torch.load(model_path)
-            # model = model.cuda()
-            # model.eval()
-
-            cls._models[model_name] = {
-                "name": model_name,
-                "path": model_path,
-                "loaded": True,
-                # "model": model,  # Actual model object
-            }
-
-            logger.info(f"Model {model_name} loaded successfully")
+        model = cls._models.get(model_name)
+        if model is not None:
+            return model
+
+        # One lock per model so concurrent loads of different models overlap
+        # while concurrent loads of the same model happen only once
+        with cls._lock:
+            model_lock = cls._model_locks.setdefault(model_name, threading.Lock())
+
+        with model_lock:
+            if model_name not in cls._models:
+                logger.info(f"Loading model {model_name} from {model_path}")
+
+                # Placeholder for actual model loading
+                # In production, replace with actual model loading code. Use a
+                # dedicated CUDA stream per model so host-to-device copies of
+                # models loaded concurrently by preload_models() overlap.
+                # non_blocking copies are only asynchronous from pinned host
+                # memory, so mmap the weights and pin them first:
+                # model = torch.load(model_path, map_location="cpu", mmap=True)
+                # for tensor in itertools.chain(model.parameters(), model.buffers()):
+                #     tensor.data = tensor.data.pin_memory()
+                # with torch.cuda.stream(torch.cuda.Stream()):
+                #     model = model.to("cuda", dtype=getattr(torch, dtype),
+                #                      non_blocking=True)
+                # model.eval()
+                dtype = settings.gpu_inference_dtype
+
+                cls._models[model_name] = {
+                    "name": model_name,
+                    "path": model_path,
+                    "dtype": dtype,
+                    "loaded": True,
+                    # "model": model,  # Actual model object
+                }
+
+                logger.info(f"Model {model_name} loaded successfully")
 
         return cls._models[model_name]
 
@@ -60,19 +100,77 @@ def preload_models():
     gpu_id = os.environ.get("CUDA_VISIBLE_DEVICES", "0")
     logger.info(f"Preloading models on GPU {gpu_id}")
 
-    # Load all three models (1GB each, fits in 24GB VRAM)
-    ModelRegistry.load_model("general", "/models/general_model.pth")
-    ModelRegistry.load_model("portrait", "/models/portrait_model.pth")
-    ModelRegistry.load_model("landscape", "/models/landscape_model.pth")
+    # Load models concurrently: weight deserialization and device copies
+    # release the GIL, so cold start costs roughly one load instead of three
+    with ThreadPoolExecutor(max_workers=len(MODEL_PATHS)) as executor:
+        futures = [
+            executor.submit(ModelRegistry.load_model, name, path)
+            for name, path in MODEL_PATHS.items()
+        ]
+        for future in futures:
+            future.result()
+
+    # In production, wait for all per-model copy streams before serving:
+    # torch.cuda.synchronize()
 
     logger.info("All models preloaded successfully")
 
 
-# Call preload on worker initialization
-try:
-    preload_models()
-except Exception as e:
-    logger.warning(f"Could not preload models (may be running without GPU): {e}")
+def _consumes_gpu_queues() -> bool:
+    """Check whether this worker was started to consume a GPU queue."""
+    consumed = celery_app.amqp.queues.consume_from
+    gpu_queues = {
+        settings.queue_gpu_general,
+        settings.queue_gpu_portrait,
+        settings.queue_gpu_landscape,
+    }
+    return not gpu_queues.isdisjoint(consumed)
+
+
+@worker_process_init.connect
+def preload_models_handler(**kwargs):
+    """
+    Load models in each pool process after it is forked.
+
+    CUDA contexts cannot be shared across fork, so every process loads its
+    own copy. Workers that only serve IO or CPU queues skip the load.
+    """
+    if not _consumes_gpu_queues():
+        return
+
+    try:
+        preload_models()
+    except Exception:
+        logger.exception("Could not preload models; GPU tasks will fail")
+
+
+@worker_init.connect
+def preload_models_init_handler(sender=None, **kwargs):
+    """
+    Load models in the worker's main process for non-forking pools.
+
+    ``worker_process_init`` only fires in prefork children and the solo
+    pool, so ``-P threads`` (or eventlet/gevent) GPU workers would never
+    preload. Prefork is skipped: CUDA must not be initialized before fork.
+    For solo the later per-process call finds the models already loaded.
+    """
+    pool_cls = concurrency.get_implementation(
+        getattr(sender, "pool_cls", None) or celery_app.conf.worker_pool
+    )
+    if issubclass(pool_cls, PreforkPool):
+        return
+
+    preload_models_handler()
+
+
+def _placeholder_upscale(image: Image.Image) -> Image.Image:
+    """
+    Simulate super-resolution by resizing to 2x.
+
+    Uses nearest-neighbour sampling, which only replicates pixels with no
+    interpolation math; output quality of the placeholder does not matter.
+    """
+    return image.resize((image.width * 2, image.height * 2), Image.Resampling.NEAREST)
 
 
 def run_inference(model_name: str, input_image_path: str, output_image_path: str):
@@ -98,21 +196,82 @@ def run_inference(model_name: str, input_image_path: str, output_image_path: str
     # Placeholder implementation
     # In production, replace with:
     # image = preprocess(Image.open(input_image_path))
-    # with torch.no_grad():
-    #     output = model(image.cuda())
+    # dtype = getattr(torch, model["dtype"])
+    # with torch.inference_mode(), torch.autocast("cuda", dtype=dtype):
+    #     output = model(image.cuda(non_blocking=True))
     # result = postprocess(output)
     # result.save(output_image_path)
 
     # For now, just copy and resize image as placeholder
-    image = Image.open(input_image_path)
-    # Simulate super-resolution: resize to 2x
-    new_size = (image.width * 2, image.height * 2)
-    result = image.resize(new_size, Image.LANCZOS)
-    result.save(output_image_path, "JPEG", quality=95)
+    with Image.open(input_image_path) as image:
+        result = _placeholder_upscale(image)
+    with open_task_file(Path(output_image_path)) as f:
+        result.save(f, "JPEG", quality=95)
 
     logger.info(f"Inference complete, saved to {output_image_path}")
 
 
+def run_inference_batch(
+    model_name: str,
+    input_image_paths: List[str],
+    output_image_paths: List[str],
+) -> List[bool]:
+    """
+    Run GPU inference for several images with a single forward pass.
+
+    Images that fail to load or save are skipped without failing the rest
+    of the batch.
+
+    Args:
+        model_name: Name of model to use
+        input_image_paths: Paths to input images
+        output_image_paths: Paths to save outputs, aligned with inputs
+
+    Returns:
+        Success flag per image, in input order
+    """
+    model = ModelRegistry.get_model(model_name)
+    if not model:
+        raise ValueError(f"Model {model_name} not loaded")
+
+    images: List[Optional[Image.Image]] = []
+    for input_image_path in input_image_paths:
+        try:
+            image = Image.open(input_image_path)
+            image.load()
+        except Exception as exc:
+            logger.error(f"Failed to load {input_image_path}: {exc}")
+            image = None
+        images.append(image)
+
+    indices = [i for i, image in enumerate(images) if image is not None]
+    logger.info(f"Running batched inference with {model_name} on {len(indices)} images")
+
+    # Placeholder implementation
+    # In production, replace with one forward pass for the whole batch:
+    # batch = torch.stack([preprocess(images[i]) for i in indices])
+    # with torch.inference_mode(), torch.autocast("cuda", dtype=dtype):
+    #     outputs = model(batch.cuda(non_blocking=True))
+    # results = [postprocess(output) for output in outputs]
+    results = [_placeholder_upscale(images[i]) for i in indices]
+
+    succeeded = [False] * len(images)
+    try:
+        for i, result in zip(indices, results):
+            try:
+                with open_task_file(Path(output_image_paths[i])) as f:
+                    result.save(f, "JPEG", quality=95)
+                succeeded[i] = True
+            except Exception as exc:
+                logger.error(f"Failed to save {output_image_paths[i]}: {exc}")
+    finally:
+        for image in images:
+            if image is not None:
+                image.close()
+
+    return succeeded
+
+
 @celery_app.task(name="gpu_inference_general", bind=True)
 def gpu_inference_general(self, task_id: str, input_path: str) -> str:
     """
@@ -173,4 +332,70 @@ def gpu_inference_landscape(self, task_id: str, input_path: str) -> str:
         return output_path
     except Exception as exc:
         logger.error(f"GPU inference failed: {exc}")
-        raise
\ No newline at end of file
+        raise
+
+
+def fail_callback(callback: Dict[str, Any], exc: Exception):
+    """
+    Mark the final task of a callback chain as failed.
+
+    The chain is never applied for a failed batch item, so without this
+    anyone waiting on its result would only see PENDING until timeout.
+
+    Args:
+        callback: Serialized callback signature (task or chain)
+        exc: Exception to store as the failure reason
+    """
+    callback_sig = signature(callback, app=celery_app)
+    tasks = getattr(callback_sig, "tasks", None)
+    final_sig = maybe_signature(tasks[-1], app=celery_app) if tasks else callback_sig
+
+    if final_sig.id is None:
+        logger.warning(f"Callback {final_sig.task} has no task ID to fail")
+        return
+
+    celery_app.backend.mark_as_failure(final_sig.id, exc)
+
+
+@celery_app.task(name="gpu_inference_batch", bind=True)
+def gpu_inference_batch(
+    self, model_name: str, requests: List[Dict[str, Any]]
+) -> List[Optional[str]]:
+    """
+    Run inference for a batch of buffered requests.
+
+    Args:
+        model_name: Name of model to use
+        requests: Items with task_id, input_path and an optional callback
+            signature that receives the output path
+
+    Returns:
+        Output paths in request order (None for failed requests)
+    """
+    logger.info(f"Running batch of {len(requests)} with {model_name}")
+
+    output_paths = [
+        str(get_task_file_path(request["task_id"], "output.jpg"))
+        for request in requests
+    ]
+    succeeded = run_inference_batch(
+        model_name, [request["input_path"] for request in requests], output_paths
+    )
+
+    for i, request in enumerate(requests):
+        if not succeeded[i]:
+            logger.error(f"GPU inference failed for task {request['task_id']}")
+            output_paths[i] = None
+            if request.get("callback"):
+                fail_callback(
+                    request["callback"],
+                    RuntimeError(f"GPU inference failed for task {request['task_id']}"),
+                )
+            continue
+
+        if request.get("callback"):
+            signature(request["callback"], app=celery_app).apply_async(
+                args=(output_paths[i],)
+            )
+
+    return output_paths
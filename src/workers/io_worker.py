@@ -1,13 +1,33 @@
 """IO-bound workers for download and upload operations."""
 import logging
-import httpx
+import os
 from pathlib import Path
 from src.core.celery_app import celery_app
 from src.core.config import settings
-from src.utils.storage import get_task_file_path, save_task_data
+from src.utils.http import get_http_client
+from src.utils.storage import atomic_task_file, get_task_file_path
 
 logger = logging.getLogger(__name__)
 
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def _drop_page_cache(fd: int):
+    """
+    Advise the kernel that a file's cached pages are no longer needed.
+
+    Uploaded results are never read again on this host, so keeping them in
+    the page cache only evicts hotter data such as model weights.
+
+    Args:
+        fd: Open file descriptor
+    """
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError as e:
+            logger.debug(f"posix_fadvise failed: {e}")
+
 
 @celery_app.task(
     name="download_image",
@@ -29,15 +49,15 @@ def download_image(self, task_id: str, image_url: str) -> str:
     try:
         logger.info(f"Downloading image from {image_url} for task {task_id}")
 
-        # Download image
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(image_url)
+        # Stream image to shared storage; readers only ever see a complete
+        # file, a failed download leaves nothing behind
+        file_path = get_task_file_path(task_id, "input.jpg")
+        with get_http_client().stream("GET", image_url, timeout=30.0) as response:
             response.raise_for_status()
-            image_data = response.content
-
-        # Save to shared storage
-        save_task_data(task_id, "input.jpg", image_data)
-        file_path = str(get_task_file_path(task_id, "input.jpg"))
+            with atomic_task_file(file_path) as f:
+                for chunk in response.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+        file_path = str(file_path)
 
         logger.info(f"Downloaded image to {file_path}")
         return file_path
@@ -75,16 +95,19 @@ def upload_result(
         if not file_path.exists():
             raise FileNotFoundError(f"Result file not found: {file_path}")
 
-        result_data = file_path.read_bytes()
-
-        # Upload to object storage
-        with httpx.Client(timeout=60.0) as client:
-            response = client.put(
+        # Upload to object storage, streaming from the open file
+        with file_path.open("rb") as f:
+            response = get_http_client().put(
                 upload_url,
-                content=result_data,
-                headers={"Content-Type": "image/jpeg"},
+                content=f,
+                headers={
+                    "Content-Type": "image/jpeg",
+                    "Content-Length": str(os.fstat(f.fileno()).st_size),
+                },
+                timeout=60.0,
             )
             response.raise_for_status()
+            _drop_page_cache(f.fileno())
 
         logger.info(f"Uploaded result to {upload_url}")
         return upload_url
@@ -1,11 +1,14 @@
 """Pytest configuration and shared fixtures."""
+import os
+import orjson
 import pytest
+import pytest_asyncio
 import asyncio
-import tempfile
 import shutil
+from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import AsyncGenerator, Generator
-from unittest.mock import Mock, MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 # Set up event loop for async tests
 @pytest.fixture(scope="session")
@@ -16,13 +19,42 @@ def event_loop():
     loop.close()
 
 
+def _redis_database_count() -> int:
+    """Get the number of databases of the local Redis (16 if unknown)."""
+    import redis
+
+    try:
+        client = redis.Redis(host="localhost", port=6379, socket_connect_timeout=0.5)
+        return int(client.config_get("databases")["databases"])
+    except (redis.RedisError, KeyError, ValueError):
+        return 16
+
+
+def _redis_test_db() -> int:
+    """
+    Get the Redis DB index for this test process.
+
+    Each pytest-xdist worker (gw0, gw1, ...) gets its own DB so parallel
+    runs do not see each other's keys; serial runs use DB 1. DB 0 is left
+    to development data, and indices wrap around the server's DB count.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    return 1 + int(worker.lstrip("gw") or 0) % (_redis_database_count() - 1)
+
+
+# Settings are read when src.core is first imported, so the real celery_app
+# used by Redis-backed tests must be pointed at the per-worker DB up front
+os.environ["REDIS_DB"] = str(_redis_test_db())
+
+
 # Celery configuration fixtures
 @pytest.fixture(scope="session")
 def celery_config():
     """Celery configuration for tests."""
+    redis_url = f"redis://localhost:6379/{os.environ['REDIS_DB']}"
     return {
-        "broker_url": "redis://localhost:6379/1",
-        "result_backend": "redis://localhost:6379/1",
+        "broker_url": redis_url,
+        "result_backend": redis_url,
         "task_always_eager": False,  # Use real workers in integration tests
         "task_eager_propagates": True,
         "task_ignore_result": False,
@@ -52,9 +84,16 @@ def celery_app_eager(celery_config_eager):
 
 
 # FastAPI test client fixtures
-@pytest.fixture
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def async_client() -> AsyncGenerator:
-    """FastAPI async test client."""
+    """
+    FastAPI async test client, shared by all tests of a module.
+
+    ASGITransport keeps no state between requests. Tests run on the module
+    event loop (``asyncio_default_test_loop_scope`` in pytest.ini). Every
+    endpoint declares a response model or return type, so FastAPI
+    serializes responses straight to JSON bytes through Pydantic.
+    """
     from httpx import AsyncClient, ASGITransport
     from src.api.main import app
 
@@ -63,6 +102,22 @@ async def async_client() -> AsyncGenerator:
         yield client
 
 
+_CLASSIFY_BODY = orjson.dumps({"task_name": "classify_image"})
+
+
+@pytest.fixture
+def submit_classify(async_client):
+    """Submit a minimal classify_image task through the async client."""
+    async def submit():
+        return await async_client.post(
+            "/api/v1/tasks",
+            content=_CLASSIFY_BODY,
+            headers={"content-type": "application/json"},
+        )
+
+    return submit
+
+
 @pytest.fixture
 def sync_client():
     """FastAPI sync test client."""
@@ -108,6 +163,34 @@ def mock_redis():
     return mock
 
 
+@dataclass
+class TaskManagerMocks:
+    """Mocks installed on TaskManager by the ``task_manager_mocks`` fixture."""
+    submit_task: MagicMock
+    wait_for_task_async: AsyncMock
+    get_task_status: MagicMock
+    long_poll_task_status: AsyncMock
+    cleanup_task: MagicMock
+
+
+@pytest.fixture
+def task_manager_mocks(monkeypatch) -> TaskManagerMocks:
+    """Replace the TaskManager methods used by the API with mocks."""
+    from src.core.task_manager import TaskManager
+
+    mocks = TaskManagerMocks(
+        submit_task=MagicMock(),
+        wait_for_task_async=AsyncMock(),
+        get_task_status=MagicMock(),
+        long_poll_task_status=AsyncMock(),
+        cleanup_task=MagicMock(),
+    )
+    for field in fields(mocks):
+        monkeypatch.setattr(TaskManager, field.name, getattr(mocks, field.name))
+
+    return mocks
+
+
 @pytest.fixture
 def mock_celery_result():
     """Mock Celery AsyncResult."""
@@ -197,15 +280,23 @@ def pytest_configure(config):
 
 
 # Skip conditions
-@pytest.fixture
+@pytest.fixture(scope="session")
 def skip_if_no_redis():
-    """Skip test if Redis is not available."""
+    """
+    Skip test if Redis is not available.
+
+    Redis is probed once per session; pytest caches the skip and replays it
+    for every later test that requests this fixture.
+    """
     import redis
 
     try:
-        r = redis.Redis(host="localhost", port=6379, db=1)
+        r = redis.Redis(
+            host="localhost", port=6379, db=int(os.environ["REDIS_DB"]),
+            socket_connect_timeout=0.5,
+        )
         r.ping()
-    except (redis.ConnectionError, redis.TimeoutError):
+    except redis.RedisError:
         pytest.skip("Redis not available")
 
 
@@ -1,9 +1,19 @@
 """End-to-end workflow tests."""
+import asyncio
+import time
 import pytest
-from pathlib import Path
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 
-from src.models import TaskState
+from src.models import TaskState, TaskStatus
+
+
+# Built once per module; tests copy it with their own task_id
+_SUCCESS_STATUS = TaskStatus(
+    task_id="mock",
+    state=TaskState.SUCCESS,
+    result={"output": "result.jpg"},
+)
 
 
 @pytest.mark.e2e
@@ -11,21 +21,14 @@ from src.models import TaskState
 class TestSuperResolutionWorkflow:
     """Test complete super-resolution workflow."""
 
-    @pytest.mark.asyncio
-    @patch("src.api.main.TaskManager.wait_for_task")
-    @patch("src.api.main.TaskManager.submit_task")
     async def test_complete_workflow_via_api(
-        self, mock_submit, mock_wait, async_client, temp_storage
+        self, task_manager_mocks, async_client, temp_storage
     ):
         """Complete super resolution from API to result."""
-        from src.models import TaskStatus
-
         # Mock task completion
-        mock_submit.return_value = "e2e-test-task"
-        mock_wait.return_value = TaskStatus(
-            task_id="e2e-test-task",
-            state=TaskState.SUCCESS,
-            result={"output": "result.jpg"},
+        task_manager_mocks.submit_task.return_value = "e2e-test-task"
+        task_manager_mocks.wait_for_task_async.return_value = _SUCCESS_STATUS.model_copy(
+            update={"task_id": "e2e-test-task"}
         )
 
         # Submit via API
@@ -45,7 +48,6 @@ class TestSuperResolutionWorkflow:
         data = response.json()
         assert data["state"] == TaskState.SUCCESS
 
-    @pytest.mark.asyncio
     @patch("src.workers.io_worker.download_image.delay")
     @patch("src.workers.cpu_worker.classify_image.delay")
     @patch("src.workers.gpu_worker.gpu_inference_general.delay")
@@ -60,28 +62,14 @@ class TestSuperResolutionWorkflow:
         sample_image,
     ):
         """Test complete pipeline: download → classify → GPU → encode."""
-        from celery.result import AsyncResult
-
-        # Mock each step returning the next input
-        mock_download_result = MagicMock(spec=AsyncResult)
-        mock_download_result.get.return_value = str(sample_image)
-        mock_download.return_value = mock_download_result
-
-        mock_classify_result = MagicMock(spec=AsyncResult)
-        mock_classify_result.get.return_value = {
-            "category": "general",
-            "width": 800,
-            "height": 600,
-        }
-        mock_classify.return_value = mock_classify_result
+        # Mock each step returning the next input; results only need .get()
+        image_path = str(sample_image)
+        classification = {"category": "general", "width": 800, "height": 600}
 
-        mock_gpu_result = MagicMock(spec=AsyncResult)
-        mock_gpu_result.get.return_value = str(sample_image)
-        mock_gpu.return_value = mock_gpu_result
-
-        mock_encode_result = MagicMock(spec=AsyncResult)
-        mock_encode_result.get.return_value = str(sample_image)
-        mock_encode.return_value = mock_encode_result
+        mock_download.return_value = SimpleNamespace(get=lambda timeout=None: image_path)
+        mock_classify.return_value = SimpleNamespace(get=lambda timeout=None: classification)
+        mock_gpu.return_value = SimpleNamespace(get=lambda timeout=None: image_path)
+        mock_encode.return_value = SimpleNamespace(get=lambda timeout=None: image_path)
 
         # Execute pipeline
         # 1. Download
@@ -109,15 +97,11 @@ class TestSuperResolutionWorkflow:
 class TestAsyncWorkflow:
     """Test async workflow without waiting for completion."""
 
-    @pytest.mark.asyncio
-    @patch("src.api.main.TaskManager.submit_task")
     async def test_async_submission_returns_immediately(
-        self, mock_submit, async_client
+        self, task_manager_mocks, async_client
     ):
         """Async mode should return immediately without waiting."""
-        import time
-
-        mock_submit.return_value = "async-task-id"
+        task_manager_mocks.submit_task.return_value = "async-task-id"
 
         start_time = time.time()
 
@@ -136,19 +120,14 @@ class TestAsyncWorkflow:
         data = response.json()
         assert data["state"] == "PENDING"
 
-    @pytest.mark.asyncio
-    @patch("src.api.main.TaskManager.submit_task")
-    @patch("src.api.main.TaskManager.get_task_status")
     async def test_async_workflow_poll_for_status(
-        self, mock_get_status, mock_submit, async_client
+        self, task_manager_mocks, async_client
     ):
         """Async workflow: submit → poll status until complete."""
-        from src.models import TaskStatus
-
-        mock_submit.return_value = "poll-task-id"
+        task_manager_mocks.submit_task.return_value = "poll-task-id"
 
         # Simulate progression
-        status_sequence = [
+        status_sequence = (
             TaskStatus(task_id="poll-task-id", state=TaskState.PENDING),
             TaskStatus(task_id="poll-task-id", state=TaskState.STARTED),
             TaskStatus(
@@ -156,9 +135,9 @@ class TestAsyncWorkflow:
                 state=TaskState.SUCCESS,
                 result={"output": "done"},
             ),
-        ]
+        )
 
-        mock_get_status.side_effect = status_sequence
+        task_manager_mocks.get_task_status.side_effect = status_sequence
 
         # 1. Submit
         submit_response = await async_client.post(
@@ -167,60 +146,61 @@ class TestAsyncWorkflow:
         )
         task_id = submit_response.json()["task_id"]
 
-        # 2. Poll status
-        for _ in range(3):
-            status_response = await async_client.get(f"/api/v1/tasks/{task_id}")
-            status = status_response.json()
-
-            if status["state"] == "SUCCESS":
-                assert status["result"]["output"] == "done"
-                break
+        # 2. Poll status (mocks resolve immediately, so bound the whole loop)
+        async def poll_until_done():
+            while True:
+                status_response = await async_client.get(f"/api/v1/tasks/{task_id}")
+                status = status_response.json()
+                if status["state"] == "SUCCESS":
+                    return status
 
+        status = await asyncio.wait_for(poll_until_done(), timeout=1.0)
 
-@pytest.mark.e2e
-class TestErrorHandling:
-    """Test error handling in E2E workflows."""
+        assert status["result"]["output"] == "done"
+        assert task_manager_mocks.get_task_status.call_count == 3
 
-    @pytest.mark.asyncio
-    @patch("src.api.main.TaskManager.wait_for_task")
-    @patch("src.api.main.TaskManager.submit_task")
-    async def test_task_failure_handling(
-        self, mock_submit, mock_wait, async_client
-    ):
-        """System should handle task failures gracefully."""
-        from src.models import TaskStatus
-
-        mock_submit.return_value = "failed-task"
-        mock_wait.return_value = TaskStatus(
-            task_id="failed-task",
-            state=TaskState.FAILURE,
-            error="Processing failed: Invalid input",
+    async def test_async_notified_completion(self, task_manager_mocks, async_client):
+        """Async workflow: submit → one long-poll request returns the result."""
+        task_manager_mocks.submit_task.return_value = "notified-task-id"
+        task_manager_mocks.long_poll_task_status.return_value = TaskStatus(
+            task_id="notified-task-id",
+            state=TaskState.SUCCESS,
+            result={"output": "done"},
         )
 
-        response = await async_client.post(
+        submit_response = await async_client.post(
             "/api/v1/tasks",
-            json={
-                "task_name": "classify_image",
-                "sync": True,
-            },
+            json={"task_name": "classify_image", "sync": False},
         )
+        task_id = submit_response.json()["task_id"]
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["state"] == "FAILURE"
-
-    @pytest.mark.asyncio
-    @patch("src.api.main.TaskManager.wait_for_task")
-    @patch("src.api.main.TaskManager.submit_task")
-    async def test_timeout_handling(self, mock_submit, mock_wait, async_client):
-        """System should handle timeouts gracefully."""
-        from src.models import TaskStatus
-
-        mock_submit.return_value = "timeout-task"
-        mock_wait.return_value = TaskStatus(
-            task_id="timeout-task",
-            state=TaskState.TIMEOUT,
-            error="Task timeout after 120s in queue",
+        status_response = await async_client.get(f"/api/v1/tasks/{task_id}?wait=30")
+
+        assert status_response.json()["state"] == "SUCCESS"
+        task_manager_mocks.long_poll_task_status.assert_called_once_with(task_id, 30)
+        task_manager_mocks.get_task_status.assert_not_called()
+
+
+@pytest.mark.e2e
+class TestErrorHandling:
+    """Test error handling in E2E workflows."""
+
+    @pytest.mark.parametrize(
+        "state,error",
+        [
+            (TaskState.FAILURE, "Processing failed: Invalid input"),
+            (TaskState.TIMEOUT, "Task timeout after 120s in queue"),
+        ],
+    )
+    async def test_terminal_state_handling(
+        self, state, error, task_manager_mocks, async_client
+    ):
+        """System should report failed and timed out tasks gracefully."""
+        task_manager_mocks.submit_task.return_value = "terminal-task"
+        task_manager_mocks.wait_for_task_async.return_value = TaskStatus(
+            task_id="terminal-task",
+            state=state,
+            error=error,
         )
 
         response = await async_client.post(
@@ -233,35 +213,24 @@ class TestErrorHandling:
 
         assert response.status_code == 200
         data = response.json()
-        assert data["state"] == "TIMEOUT"
+        assert data["state"] == state.value
 
 
 @pytest.mark.e2e
 class TestCleanupWorkflow:
     """Test cleanup in E2E workflows."""
 
-    @pytest.mark.asyncio
-    @patch("src.api.main.TaskManager.submit_task")
-    @patch("src.api.main.TaskManager.get_task_status")
-    @patch("src.api.main.TaskManager.cleanup_task")
     async def test_complete_lifecycle_with_cleanup(
-        self, mock_cleanup, mock_get_status, mock_submit, async_client, temp_storage
+        self, submit_classify, task_manager_mocks, async_client, temp_storage
     ):
         """Test complete lifecycle: submit → complete → cleanup."""
-        from src.models import TaskStatus
-
-        mock_submit.return_value = "lifecycle-task"
-        mock_get_status.return_value = TaskStatus(
-            task_id="lifecycle-task",
-            state=TaskState.SUCCESS,
-            result={"output": "result.jpg"},
+        task_manager_mocks.submit_task.return_value = "lifecycle-task"
+        task_manager_mocks.get_task_status.return_value = _SUCCESS_STATUS.model_copy(
+            update={"task_id": "lifecycle-task"}
         )
 
         # 1. Submit
-        submit_response = await async_client.post(
-            "/api/v1/tasks",
-            json={"task_name": "classify_image"},
-        )
+        submit_response = await submit_classify()
         task_id = submit_response.json()["task_id"]
 
         # 2. Wait for completion (by checking status)
@@ -272,7 +241,7 @@ class TestCleanupWorkflow:
         cleanup_response = await async_client.delete(f"/api/v1/tasks/{task_id}")
         assert cleanup_response.status_code == 200
 
-        mock_cleanup.assert_called_once_with(task_id)
+        task_manager_mocks.cleanup_task.assert_called_once_with(task_id)
 
 
 @pytest.mark.e2e
@@ -280,23 +249,13 @@ class TestCleanupWorkflow:
 class TestMultipleWorkflows:
     """Test multiple workflows running concurrently."""
 
-    @pytest.mark.asyncio
-    @patch("src.api.main.TaskManager.submit_task")
-    async def test_concurrent_task_submissions(self, mock_submit, async_client):
+    async def test_concurrent_task_submissions(self, submit_classify, task_manager_mocks):
         """System should handle multiple concurrent submissions."""
-        import asyncio
-
         # Generate unique task IDs
-        mock_submit.side_effect = [f"concurrent-task-{i}" for i in range(10)]
+        task_manager_mocks.submit_task.side_effect = (f"concurrent-task-{i}" for i in range(10))
 
         # Submit multiple tasks concurrently
-        tasks = []
-        for i in range(10):
-            task = async_client.post(
-                "/api/v1/tasks",
-                json={"task_name": "classify_image"},
-            )
-            tasks.append(task)
+        tasks = [submit_classify() for _ in range(10)]
 
         responses = await asyncio.gather(*tasks)
 
@@ -307,48 +266,25 @@ class TestMultipleWorkflows:
         task_ids = [r.json()["task_id"] for r in responses]
         assert len(set(task_ids)) == 10
 
-    @pytest.mark.asyncio
-    @patch("src.api.main.TaskManager.submit_task")
-    @patch("src.api.main.TaskManager.get_task_status")
     async def test_interleaved_submit_and_status_checks(
-        self, mock_get_status, mock_submit, async_client
+        self, submit_classify, task_manager_mocks, async_client
     ):
-        """System should handle interleaved submissions and status checks."""
-        from src.models import TaskStatus
-
-        mock_submit.side_effect = ["task-1", "task-2", "task-3"]
-        mock_get_status.side_effect = [
+        """System should handle overlapping submissions and status checks."""
+        task_manager_mocks.submit_task.side_effect = ("task-1", "task-2", "task-3")
+        task_manager_mocks.get_task_status.side_effect = (
             TaskStatus(task_id="task-1", state=TaskState.PENDING),
             TaskStatus(task_id="task-2", state=TaskState.STARTED),
             TaskStatus(task_id="task-3", state=TaskState.SUCCESS),
-        ]
-
-        # Submit task 1
-        r1 = await async_client.post(
-            "/api/v1/tasks", json={"task_name": "classify_image"}
         )
-        task1_id = r1.json()["task_id"]
 
-        # Check task 1 status
-        s1 = await async_client.get(f"/api/v1/tasks/{task1_id}")
+        # Submit all tasks, then check all statuses, each batch concurrently
+        submits = await asyncio.gather(*(submit_classify() for _ in range(3)))
+        task_ids = [r.json()["task_id"] for r in submits]
 
-        # Submit task 2
-        r2 = await async_client.post(
-            "/api/v1/tasks", json={"task_name": "classify_image"}
+        statuses = await asyncio.gather(
+            *(async_client.get(f"/api/v1/tasks/{task_id}") for task_id in task_ids)
         )
-        task2_id = r2.json()["task_id"]
-
-        # Check task 2 status
-        s2 = await async_client.get(f"/api/v1/tasks/{task2_id}")
-
-        # Submit task 3
-        r3 = await async_client.post(
-            "/api/v1/tasks", json={"task_name": "classify_image"}
-        )
-        task3_id = r3.json()["task_id"]
-
-        # Check task 3 status
-        s3 = await async_client.get(f"/api/v1/tasks/{task3_id}")
 
         # All operations should succeed
-        assert all(r.status_code == 200 for r in [r1, r2, r3, s1, s2, s3])
\ No newline at end of file
+        assert sorted(task_ids) == ["task-1", "task-2", "task-3"]
+        assert all(r.status_code == 200 for r in [*submits, *statuses])
@@ -1,15 +1,22 @@
 """Integration tests for FastAPI endpoints."""
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
-from src.models import TaskState, TaskPriority
+from src.models import TaskState, TaskStatus
+
+
+# Built once per module; tests copy it with their own task_id
+_SUCCESS_STATUS = TaskStatus(
+    task_id="mock",
+    state=TaskState.SUCCESS,
+    result={"output": "result.jpg"},
+)
 
 
 @pytest.mark.integration
 class TestSubmitTaskEndpoint:
     """Test POST /api/v1/tasks endpoint."""
 
-    @pytest.mark.asyncio
     async def test_submit_task_returns_200(self, async_client, skip_if_no_redis):
         """POST /api/v1/tasks should return 200 with valid request."""
         request_data = {
@@ -30,7 +37,6 @@ class TestSubmitTaskEndpoint:
         assert "state" in data
         assert data["state"] == "PENDING"
 
-    @pytest.mark.asyncio
     async def test_submit_task_minimal_request(self, async_client, skip_if_no_redis):
         """POST /api/v1/tasks should work with minimal request."""
         request_data = {
@@ -46,7 +52,6 @@ class TestSubmitTaskEndpoint:
         data = response.json()
         assert "task_id" in data
 
-    @pytest.mark.asyncio
     async def test_submit_task_with_kwargs(self, async_client, skip_if_no_redis):
         """POST /api/v1/tasks should accept kwargs."""
         request_data = {
@@ -65,7 +70,6 @@ class TestSubmitTaskEndpoint:
 
         assert response.status_code == 200
 
-    @pytest.mark.asyncio
     async def test_submit_task_invalid_name_returns_500(
         self, async_client, skip_if_no_redis
     ):
@@ -81,7 +85,6 @@ class TestSubmitTaskEndpoint:
 
         assert response.status_code == 500
 
-    @pytest.mark.asyncio
     async def test_submit_task_missing_task_name_returns_422(self, async_client):
         """POST /api/v1/tasks should return 422 for missing task_name."""
         request_data = {
@@ -95,20 +98,11 @@ class TestSubmitTaskEndpoint:
 
         assert response.status_code == 422
 
-    @pytest.mark.asyncio
-    @patch("src.api.main.TaskManager.wait_for_task")
-    @patch("src.api.main.TaskManager.submit_task")
-    async def test_submit_task_sync_mode(
-        self, mock_submit, mock_wait, async_client
-    ):
+    async def test_submit_task_sync_mode(self, task_manager_mocks, async_client):
         """POST /api/v1/tasks with sync=True should wait for completion."""
-        from src.models import TaskStatus
-
-        mock_submit.return_value = "sync-task-id"
-        mock_wait.return_value = TaskStatus(
-            task_id="sync-task-id",
-            state=TaskState.SUCCESS,
-            result={"output": "result.jpg"},
+        task_manager_mocks.submit_task.return_value = "sync-task-id"
+        task_manager_mocks.wait_for_task_async.return_value = _SUCCESS_STATUS.model_copy(
+            update={"task_id": "sync-task-id"}
         )
 
         request_data = {
@@ -125,34 +119,26 @@ class TestSubmitTaskEndpoint:
         data = response.json()
         assert data["state"] == "SUCCESS"
 
-        # Verify wait_for_task was called
-        mock_wait.assert_called_once()
+        # Verify wait_for_task_async was called
+        task_manager_mocks.wait_for_task_async.assert_called_once()
 
 
 @pytest.mark.integration
 class TestGetTaskStatusEndpoint:
     """Test GET /api/v1/tasks/{task_id} endpoint."""
 
-    @pytest.mark.asyncio
-    @patch("src.api.main.TaskManager.submit_task")
-    @patch("src.api.main.TaskManager.get_task_status")
     async def test_get_task_status_returns_200(
-        self, mock_get_status, mock_submit, async_client
+        self, submit_classify, task_manager_mocks, async_client
     ):
         """GET /api/v1/tasks/{id} should return 200."""
-        from src.models import TaskStatus
-
-        mock_submit.return_value = "test-task-id"
-        mock_get_status.return_value = TaskStatus(
+        task_manager_mocks.submit_task.return_value = "test-task-id"
+        task_manager_mocks.get_task_status.return_value = TaskStatus(
             task_id="test-task-id",
             state=TaskState.PENDING,
         )
 
         # Submit task first
-        submit_response = await async_client.post(
-            "/api/v1/tasks",
-            json={"task_name": "classify_image"},
-        )
+        submit_response = await submit_classify()
         task_id = submit_response.json()["task_id"]
 
         # Get status
@@ -165,16 +151,10 @@ class TestGetTaskStatusEndpoint:
         assert data["task_id"] == task_id
         assert "state" in data
 
-    @pytest.mark.asyncio
-    @patch("src.api.main.TaskManager.get_task_status")
-    async def test_get_task_status_structure(self, mock_get_status, async_client):
+    async def test_get_task_status_structure(self, task_manager_mocks, async_client):
         """GET /api/v1/tasks/{id} should return complete status structure."""
-        from src.models import TaskStatus
-
-        mock_get_status.return_value = TaskStatus(
-            task_id="test-task",
-            state=TaskState.SUCCESS,
-            result={"output": "result.jpg"},
+        task_manager_mocks.get_task_status.return_value = _SUCCESS_STATUS.model_copy(
+            update={"task_id": "test-task"}
         )
 
         response = await async_client.get("/api/v1/tasks/test-task")
@@ -185,13 +165,9 @@ class TestGetTaskStatusEndpoint:
         assert "state" in data
         assert "result" in data
 
-    @pytest.mark.asyncio
-    @patch("src.api.main.TaskManager.get_task_status")
-    async def test_get_task_status_failed_task(self, mock_get_status, async_client):
+    async def test_get_task_status_failed_task(self, task_manager_mocks, async_client):
         """GET /api/v1/tasks/{id} should return error information."""
-        from src.models import TaskStatus
-
-        mock_get_status.return_value = TaskStatus(
+        task_manager_mocks.get_task_status.return_value = TaskStatus(
             task_id="failed-task",
             state=TaskState.FAILURE,
             error="Processing failed",
@@ -205,14 +181,32 @@ class TestGetTaskStatusEndpoint:
         assert "error" in data
         assert data["error"] == "Processing failed"
 
+    async def test_get_task_status_long_poll(self, task_manager_mocks, async_client):
+        """GET /api/v1/tasks/{id}?wait=N should long-poll the task."""
+        task_manager_mocks.long_poll_task_status.return_value = TaskStatus(
+            task_id="poll-task",
+            state=TaskState.SUCCESS,
+        )
+
+        response = await async_client.get("/api/v1/tasks/poll-task?wait=30")
+
+        assert response.status_code == 200
+        assert response.json()["state"] == "SUCCESS"
+        task_manager_mocks.long_poll_task_status.assert_called_once_with("poll-task", 30)
+        task_manager_mocks.get_task_status.assert_not_called()
+
+    async def test_get_task_status_wait_out_of_range(self, async_client):
+        """wait above the limit should be rejected."""
+        response = await async_client.get("/api/v1/tasks/poll-task?wait=3600")
+
+        assert response.status_code == 422
+
 
 @pytest.mark.integration
 class TestCleanupTaskEndpoint:
     """Test DELETE /api/v1/tasks/{task_id} endpoint."""
 
-    @pytest.mark.asyncio
-    @patch("src.api.main.TaskManager.cleanup_task")
-    async def test_cleanup_task_returns_200(self, mock_cleanup, async_client):
+    async def test_cleanup_task_returns_200(self, task_manager_mocks, async_client):
         """DELETE /api/v1/tasks/{id} should return 200."""
         response = await async_client.delete("/api/v1/tasks/test-task-id")
 
@@ -221,11 +215,9 @@ class TestCleanupTaskEndpoint:
         assert data["status"] == "success"
 
         # Verify cleanup was called
-        mock_cleanup.assert_called_once_with("test-task-id")
+        task_manager_mocks.cleanup_task.assert_called_once_with("test-task-id")
 
-    @pytest.mark.asyncio
-    @patch("src.api.main.TaskManager.cleanup_task")
-    async def test_cleanup_task_message(self, mock_cleanup, async_client):
+    async def test_cleanup_task_message(self, task_manager_mocks, async_client):
         """DELETE /api/v1/tasks/{id} should return confirmation message."""
         response = await async_client.delete("/api/v1/tasks/cleanup-test")
 
@@ -234,22 +226,54 @@ class TestCleanupTaskEndpoint:
         assert "message" in data
         assert "cleanup-test" in data["message"]
 
-    @pytest.mark.asyncio
-    @patch("src.api.main.TaskManager.cleanup_task")
-    async def test_cleanup_task_error_returns_500(self, mock_cleanup, async_client):
+    async def test_cleanup_task_error_returns_500(
+        self, task_manager_mocks, async_client
+    ):
         """DELETE /api/v1/tasks/{id} should return 500 on error."""
-        mock_cleanup.side_effect = Exception("Cleanup failed")
+        task_manager_mocks.cleanup_task.side_effect = Exception("Cleanup failed")
 
         response = await async_client.delete("/api/v1/tasks/error-task")
 
         assert response.status_code == 500
 
 
+@pytest.mark.integration
+class TestDashboardEndpoint:
+    """Test GET /dashboard/ endpoint."""
+
+    async def test_dashboard_returns_cacheable_html(self, async_client):
+        """Dashboard page should be HTML with a short cache lifetime."""
+        response = await async_client.get("/dashboard/")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "text/html; charset=utf-8"
+        assert response.headers["cache-control"] == "max-age=5"
+        assert "Task Manager Dashboard" in response.text
+
+
+@pytest.mark.integration
+class TestDashboardTaskStatusesEndpoint:
+    """Test GET /dashboard/tasks endpoint."""
+
+    @patch("src.monitoring.dashboard.TaskManager.get_task_statuses")
+    async def test_bulk_status_returns_all(self, mock_get_statuses, async_client):
+        """GET /dashboard/tasks should return statuses for all ids in order."""
+        mock_get_statuses.return_value = [
+            TaskStatus(task_id="task-1", state=TaskState.SUCCESS),
+            TaskStatus(task_id="task-2", state=TaskState.PENDING),
+        ]
+
+        response = await async_client.get("/dashboard/tasks?ids=task-1&ids=task-2")
+
+        assert response.status_code == 200
+        assert [s["task_id"] for s in response.json()] == ["task-1", "task-2"]
+        mock_get_statuses.assert_called_once_with(["task-1", "task-2"])
+
+
 @pytest.mark.integration
 class TestHealthEndpoint:
     """Test /health endpoint."""
 
-    @pytest.mark.asyncio
     async def test_health_returns_200(self, async_client):
         """GET /health should return 200."""
         response = await async_client.get("/health")
@@ -258,7 +282,6 @@ class TestHealthEndpoint:
         data = response.json()
         assert data["status"] == "healthy"
 
-    @pytest.mark.asyncio
     async def test_health_includes_metadata(self, async_client):
         """GET /health should include service metadata."""
         response = await async_client.get("/health")
@@ -273,14 +296,12 @@ class TestHealthEndpoint:
 class TestRootEndpoint:
     """Test / root endpoint."""
 
-    @pytest.mark.asyncio
     async def test_root_returns_200(self, async_client):
         """GET / should return 200."""
         response = await async_client.get("/")
 
         assert response.status_code == 200
 
-    @pytest.mark.asyncio
     async def test_root_includes_api_info(self, async_client):
         """GET / should include API information."""
         response = await async_client.get("/")
@@ -296,29 +317,18 @@ class TestRootEndpoint:
 class TestAPIIntegration:
     """Test API endpoints working together."""
 
-    @pytest.mark.asyncio
-    @patch("src.api.main.TaskManager.submit_task")
-    @patch("src.api.main.TaskManager.get_task_status")
-    @patch("src.api.main.TaskManager.cleanup_task")
     async def test_full_api_workflow(
-        self, mock_cleanup, mock_get_status, mock_submit, async_client
+        self, submit_classify, task_manager_mocks, async_client
     ):
         """Test complete workflow: submit → status → cleanup."""
-        from src.models import TaskStatus
-
         # Mock responses
-        mock_submit.return_value = "workflow-task-id"
-        mock_get_status.return_value = TaskStatus(
-            task_id="workflow-task-id",
-            state=TaskState.SUCCESS,
-            result={"output": "result.jpg"},
+        task_manager_mocks.submit_task.return_value = "workflow-task-id"
+        task_manager_mocks.get_task_status.return_value = _SUCCESS_STATUS.model_copy(
+            update={"task_id": "workflow-task-id"}
         )
 
         # 1. Submit task
-        submit_response = await async_client.post(
-            "/api/v1/tasks",
-            json={"task_name": "classify_image"},
-        )
+        submit_response = await submit_classify()
         assert submit_response.status_code == 200
         task_id = submit_response.json()["task_id"]
 
@@ -330,16 +340,13 @@ class TestAPIIntegration:
         cleanup_response = await async_client.delete(f"/api/v1/tasks/{task_id}")
         assert cleanup_response.status_code == 200
 
-    @pytest.mark.asyncio
-    async def test_cors_headers_present(self, async_client):
+    def test_cors_headers_present(self):
         """API should include CORS headers."""
-        response = await async_client.options(
-            "/api/v1/tasks",
-            headers={"Origin": "http://localhost:3000"},
-        )
+        from starlette.middleware.cors import CORSMiddleware
+        from src.api.main import app
 
         # CORS should be enabled
-        assert response.status_code in [200, 405]  # 405 if OPTIONS not explicitly handled
+        assert any(mw.cls is CORSMiddleware for mw in app.user_middleware)
 
 
 @pytest.mark.integration
@@ -2,9 +2,10 @@
 import pytest
 import time
 from unittest.mock import Mock, patch, MagicMock
+from celery.exceptions import TimeoutError as CeleryTimeoutError
 
-from src.core.task_manager import TaskManager
-from src.models import TaskState, TaskPriority, SubTaskConfig, WorkerType
+from src.core.task_manager import TaskManager, _resolve_task
+from src.models import TaskState, TaskPriority, TaskRequest, SubTaskConfig, WorkerType
 
 
 @pytest.mark.integration
@@ -66,6 +67,65 @@ class TestSubmitTask:
         assert len(task_ids) == 5
         assert len(set(task_ids)) == 5  # All unique
 
+    def test_submit_tasks_bulk(self, skip_if_no_redis):
+        """submit_tasks should return one unique ID per request."""
+        requests = [
+            TaskRequest(task_name="classify_image", args=(f"task-{i}", "/path/image.jpg"))
+            for i in range(5)
+        ]
+
+        task_ids = TaskManager.submit_tasks(requests)
+
+        assert len(set(task_ids)) == 5
+        assert all(
+            TaskManager.get_task_status(task_id).state == TaskState.PENDING
+            for task_id in task_ids
+        )
+
+    @patch("src.core.task_manager.celery_app.producer_or_acquire")
+    @patch("src.core.task_manager._resolve_task")
+    def test_submit_tasks_single_pipeline_and_producer(self, mock_resolve, mock_acquire):
+        """submit_tasks should pipeline backend writes and share one producer."""
+        from src.core.celery_app import celery_app
+
+        requests = [TaskRequest(task_name="classify_image") for _ in range(3)]
+
+        with patch.object(celery_app.backend, "client") as mock_client:
+            task_ids = TaskManager.submit_tasks(requests)
+
+        pipe = mock_client.pipeline.return_value.__enter__.return_value
+        pipe.execute.assert_called_once()
+        mock_acquire.assert_called_once()
+        producer = mock_acquire.return_value.__enter__.return_value
+        calls = mock_resolve.return_value.apply_async.call_args_list
+        assert [c.kwargs["task_id"] for c in calls] == task_ids
+        assert all(c.kwargs["producer"] is producer for c in calls)
+
+
+@pytest.mark.integration
+class TestResolveTask:
+    """Test cached task lookup."""
+
+    def test_resolve_task_returns_registered_task(self):
+        """Registered tasks should resolve to the Celery task object."""
+        from src.core.celery_app import celery_app
+
+        assert _resolve_task("classify_image") is celery_app.tasks["classify_image"]
+
+    def test_resolve_task_is_cached(self):
+        """Repeated lookups should be served from the cache."""
+        _resolve_task("encode_result")
+        hits = _resolve_task.cache_info().hits
+
+        _resolve_task("encode_result")
+
+        assert _resolve_task.cache_info().hits == hits + 1
+
+    def test_resolve_task_invalid_name_raises_error(self):
+        """Unknown task names should raise ValueError."""
+        with pytest.raises(ValueError, match="not found"):
+            _resolve_task("nonexistent_task")
+
 
 @pytest.mark.integration
 class TestSubmitSubtasks:
@@ -141,6 +201,35 @@ class TestSubmitSubtasks:
 
         assert len(subtask_ids) == 1
 
+    @patch("src.core.task_manager.chord")
+    def test_submit_parallel_subtasks_with_callback(self, mock_chord):
+        """Parallel subtasks with a callback should be submitted as a chord."""
+        subtask_configs = [
+            SubTaskConfig(
+                name="classify_image",
+                worker_type=WorkerType.CPU,
+                queue="cpu_queue",
+                args=[f"task{i}", f"/path{i}"],
+            )
+            for i in range(3)
+        ]
+        callback = Mock()
+        chord_result = MagicMock()
+        chord_result.id = "chord-callback-id"
+        mock_chord.return_value.return_value = chord_result
+
+        subtask_ids = TaskManager.submit_subtasks(
+            parent_task_id="parent-chord",
+            subtask_configs=subtask_configs,
+            parallel=True,
+            callback=callback,
+        )
+
+        assert subtask_ids == ["chord-callback-id"]
+        assert len(mock_chord.call_args[0][0]) == 3
+        mock_chord.return_value.assert_called_once_with(callback)
+        chord_result.parent.save.assert_called_once()
+
     def test_submit_subtasks_invalid_task_raises_error(self, skip_if_no_redis):
         """submit_subtasks should raise error for invalid task."""
         subtask_configs = [
@@ -196,13 +285,169 @@ class TestGetTaskStatus:
         assert status.state == TaskState.PENDING
 
 
+@pytest.mark.integration
+class TestQueueTimeout:
+    """Test queue timeout detection from the submission time."""
+
+    @patch("src.core.task_manager._resolve_task")
+    def test_submit_task_records_submitted_at(self, mock_resolve):
+        """submit_task should store the epoch submission time as PENDING meta."""
+        from src.core.celery_app import celery_app
+
+        backend = celery_app.backend
+        before = time.time()
+
+        with patch.object(backend, "client") as mock_client:
+            TaskManager.submit_task(task_name="classify_image")
+
+        pipe = mock_client.pipeline.return_value.__enter__.return_value
+        mock_client.get.assert_not_called()
+        pipe.execute.assert_called_once()
+        write = pipe.setex if backend.expires else pipe.set
+        key, value = write.call_args.args[0], write.call_args.args[-1]
+        meta = backend.decode_result(value)
+        apply_async = mock_resolve.return_value.apply_async
+        task_id = apply_async.call_args.kwargs["task_id"]
+        assert key == backend.get_key_for_task(task_id)
+        assert meta["status"] == "PENDING"
+        assert before <= meta["result"]["submitted_at"] <= time.time()
+
+    @patch("src.core.task_manager.notify_admin_timeout")
+    @patch("src.core.task_manager.AsyncResult")
+    def test_pending_task_times_out(self, mock_async_result, mock_notify):
+        """Task queued longer than task_queue_timeout should time out."""
+        from src.core.config import settings
+
+        result = mock_async_result.return_value
+        result.state = "PENDING"
+        result.info = {"submitted_at": time.time() - settings.task_queue_timeout - 5}
+        result.failed.return_value = False
+        result.successful.return_value = False
+
+        status = TaskManager.get_task_status("queued-task")
+
+        assert status.state == TaskState.TIMEOUT
+        assert status.submitted_at is not None
+        result.revoke.assert_called_once_with(terminate=True)
+        mock_notify.assert_called_once()
+
+    @patch("src.core.task_manager.notify_admin_timeout")
+    @patch("src.core.task_manager.AsyncResult")
+    def test_recent_pending_task_not_timed_out(self, mock_async_result, mock_notify):
+        """Recently submitted task should stay PENDING."""
+        result = mock_async_result.return_value
+        result.state = "PENDING"
+        result.info = {"submitted_at": time.time()}
+        result.failed.return_value = False
+        result.successful.return_value = False
+
+        status = TaskManager.get_task_status("queued-task")
+
+        assert status.state == TaskState.PENDING
+        mock_notify.assert_not_called()
+
+
+@pytest.mark.integration
+class TestGetTaskStatuses:
+    """Test bulk task status retrieval."""
+
+    def test_get_task_statuses_single_mget(self):
+        """Bulk lookup should fetch all tasks with one MGET."""
+        from src.core.celery_app import celery_app
+
+        backend = celery_app.backend
+        values = [
+            backend.encode({"status": "SUCCESS", "result": {"done": True}}),
+            None,
+            backend.encode({"status": "STARTED", "result": None}),
+        ]
+
+        with patch.object(backend, "mget", return_value=values) as mock_mget:
+            statuses = TaskManager.get_task_statuses(["t1", "t2", "t3"])
+
+        mock_mget.assert_called_once()
+        assert len(mock_mget.call_args[0][0]) == 3
+        assert [s.task_id for s in statuses] == ["t1", "t2", "t3"]
+        assert [s.state for s in statuses] == [
+            TaskState.SUCCESS,
+            TaskState.PENDING,
+            TaskState.STARTED,
+        ]
+        assert statuses[0].result == {"done": True}
+        assert statuses[1].result is None
+
+
+@pytest.mark.integration
+class TestLongPollTaskStatus:
+    """Test long-poll task status retrieval."""
+
+    @patch("src.core.task_manager.asyncio.sleep")
+    @patch("src.core.task_manager.TaskManager.get_task_status")
+    async def test_finished_task_returns_immediately(self, mock_get_status, mock_sleep):
+        """Finished task should be returned without waiting."""
+        from src.models import TaskStatus
+
+        mock_get_status.return_value = TaskStatus(task_id="t", state=TaskState.SUCCESS)
+
+        status = await TaskManager.long_poll_task_status("t", wait=30)
+
+        assert status.state == TaskState.SUCCESS
+        mock_sleep.assert_not_called()
+
+    @patch("src.core.task_manager.TaskManager.get_task_status")
+    async def test_returns_when_task_finishes(self, mock_get_status):
+        """Long-poll should return as soon as the task reaches a final state."""
+        from src.models import TaskStatus
+
+        mock_get_status.side_effect = [
+            TaskStatus(task_id="t", state=TaskState.PENDING),
+            TaskStatus(task_id="t", state=TaskState.STARTED),
+            TaskStatus(task_id="t", state=TaskState.SUCCESS),
+        ]
+
+        status = await TaskManager.long_poll_task_status("t", wait=5, poll_interval=0.01)
+
+        assert status.state == TaskState.SUCCESS
+        assert mock_get_status.call_count == 3
+
+    @patch("src.core.task_manager.TaskManager.get_task_status")
+    async def test_timeout_returns_current_status(self, mock_get_status):
+        """On wait timeout the current status should be returned."""
+        from src.models import TaskStatus
+
+        mock_get_status.return_value = TaskStatus(task_id="t", state=TaskState.STARTED)
+
+        status = await TaskManager.long_poll_task_status("t", wait=0.05, poll_interval=0.01)
+
+        assert status.state == TaskState.STARTED
+
+    @patch("src.core.task_manager.asyncio.to_thread")
+    async def test_waiting_holds_no_thread(self, mock_to_thread):
+        """Only the status reads should be dispatched to the thread pool."""
+        from src.models import TaskStatus
+
+        mock_to_thread.return_value = TaskStatus(task_id="t", state=TaskState.PENDING)
+
+        await TaskManager.long_poll_task_status("t", wait=0.05, poll_interval=0.01)
+
+        for call in mock_to_thread.call_args_list:
+            assert call.args[0] is TaskManager.get_task_status
+
+
+def _block_until_timeout(timeout=None, **kwargs):
+    """Simulate AsyncResult.get on a task that never finishes."""
+    time.sleep(timeout)
+    raise CeleryTimeoutError()
+
+
 @pytest.mark.integration
 @pytest.mark.slow
 class TestWaitForTask:
     """Test synchronous task waiting."""
 
+    @patch("src.core.task_manager.AsyncResult")
     @patch("src.core.task_manager.TaskManager.get_task_status")
-    def test_wait_for_task_success(self, mock_get_status):
+    def test_wait_for_task_success(self, mock_get_status, mock_async_result):
         """wait_for_task should return when task succeeds."""
         # Mock progression: PENDING → STARTED → SUCCESS
         from src.models import TaskStatus
@@ -218,8 +463,27 @@ class TestWaitForTask:
         assert status.state == TaskState.SUCCESS
         assert status.result == {"done": True}
 
+    @patch("src.core.task_manager.AsyncResult")
+    @patch("src.core.task_manager.TaskManager.get_task_status")
+    def test_wait_for_task_blocks_on_backend(self, mock_get_status, mock_async_result):
+        """wait_for_task should block on the result backend, not sleep."""
+        from src.models import TaskStatus
+
+        mock_get_status.side_effect = [
+            TaskStatus(task_id="test", state=TaskState.PENDING),
+            TaskStatus(task_id="test", state=TaskState.SUCCESS),
+        ]
+
+        TaskManager.wait_for_task("test", timeout=5.0, poll_interval=0.1)
+
+        get = mock_async_result.return_value.get
+        get.assert_called_once()
+        assert get.call_args.kwargs["propagate"] is False
+        assert 0 < get.call_args.kwargs["timeout"] <= 5.0
+
+    @patch("src.core.task_manager.AsyncResult")
     @patch("src.core.task_manager.TaskManager.get_task_status")
-    def test_wait_for_task_failure(self, mock_get_status):
+    def test_wait_for_task_failure(self, mock_get_status, mock_async_result):
         """wait_for_task should return when task fails."""
         from src.models import TaskStatus
 
@@ -234,8 +498,9 @@ class TestWaitForTask:
         assert status.state == TaskState.FAILURE
         assert status.error == "Processing error"
 
+    @patch("src.core.task_manager.AsyncResult")
     @patch("src.core.task_manager.TaskManager.get_task_status")
-    def test_wait_for_task_timeout(self, mock_get_status):
+    def test_wait_for_task_timeout(self, mock_get_status, mock_async_result):
         """wait_for_task should timeout if task doesn't complete."""
         from src.models import TaskStatus
 
@@ -244,14 +509,16 @@ class TestWaitForTask:
             task_id="test",
             state=TaskState.PENDING,
         )
+        mock_async_result.return_value.get.side_effect = _block_until_timeout
 
         status = TaskManager.wait_for_task("test", timeout=0.5, poll_interval=0.1)
 
         assert status.state == TaskState.TIMEOUT
         assert "timeout" in status.error.lower()
 
+    @patch("src.core.task_manager.AsyncResult")
     @patch("src.core.task_manager.TaskManager.get_task_status")
-    def test_wait_for_task_revoked(self, mock_get_status):
+    def test_wait_for_task_revoked(self, mock_get_status, mock_async_result):
         """wait_for_task should return when task is revoked."""
         from src.models import TaskStatus
 
@@ -265,6 +532,144 @@ class TestWaitForTask:
         assert status.state == TaskState.REVOKED
 
 
+@pytest.mark.integration
+class TestWaitForTaskAsync:
+    """Test non-blocking task waiting used by the API."""
+
+    @pytest.mark.asyncio
+    @patch("src.core.task_manager.TaskManager.get_task_status")
+    async def test_wait_for_task_async_success(self, mock_get_status):
+        """wait_for_task_async should return when task succeeds."""
+        from src.models import TaskStatus
+
+        mock_get_status.side_effect = [
+            TaskStatus(task_id="test", state=TaskState.PENDING),
+            TaskStatus(task_id="test", state=TaskState.SUCCESS, result={"done": True}),
+        ]
+
+        status = await TaskManager.wait_for_task_async(
+            "test", timeout=5.0, poll_interval=0.01
+        )
+
+        assert status.state == TaskState.SUCCESS
+        assert status.result == {"done": True}
+
+    @pytest.mark.asyncio
+    @patch("src.core.task_manager.asyncio.sleep")
+    @patch("src.core.task_manager.TaskManager.get_task_status")
+    async def test_wait_for_task_async_backoff(self, mock_get_status, mock_sleep):
+        """Delay between status checks should grow exponentially up to the cap."""
+        from src.models import TaskStatus
+
+        mock_get_status.side_effect = [
+            TaskStatus(task_id="test", state=TaskState.PENDING),
+        ] * 4 + [TaskStatus(task_id="test", state=TaskState.SUCCESS)]
+
+        await TaskManager.wait_for_task_async(
+            "test", poll_interval=1.0, backoff=2.0, max_interval=5.0
+        )
+
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert delays == [1.0, 2.0, 4.0, 5.0]
+
+    @pytest.mark.asyncio
+    @patch("src.core.task_manager.update_task_duration")
+    @patch("src.core.task_manager.get_task_duration", return_value=4.0)
+    @patch("src.core.task_manager.asyncio.sleep")
+    @patch("src.core.task_manager.TaskManager.get_task_status")
+    async def test_wait_for_task_async_seeded_from_history(
+        self, mock_get_status, mock_sleep, mock_get_duration, mock_update
+    ):
+        """First delay should be seeded from the task's duration EWMA."""
+        from src.models import TaskStatus
+
+        mock_get_status.side_effect = [
+            TaskStatus(task_id="test", state=TaskState.PENDING),
+            TaskStatus(task_id="test", state=TaskState.SUCCESS),
+        ]
+
+        await TaskManager.wait_for_task_async("test", task_name="classify_image")
+
+        mock_get_duration.assert_called_once_with("classify_image")
+        assert mock_sleep.call_args_list[0].args[0] == 1.0
+
+    @pytest.mark.asyncio
+    @patch("src.core.task_manager.update_task_duration")
+    @patch("src.core.task_manager.get_task_duration", return_value=None)
+    @patch("src.core.task_manager.TaskManager.get_task_status")
+    async def test_wait_for_task_async_records_duration(
+        self, mock_get_status, mock_get_duration, mock_update
+    ):
+        """A successful wait should record the submitted task's duration."""
+        from src.models import TaskStatus
+
+        mock_get_status.side_effect = [
+            TaskStatus(task_id="test", state=TaskState.PENDING),
+            TaskStatus(task_id="test", state=TaskState.SUCCESS),
+        ]
+
+        await TaskManager.wait_for_task_async(
+            "test", poll_interval=0.01, task_name="image_super_resolution_pipeline"
+        )
+
+        mock_update.assert_called_once()
+        task_name, duration = mock_update.call_args.args
+        assert task_name == "image_super_resolution_pipeline"
+        assert duration >= 0.01
+
+    @pytest.mark.asyncio
+    @patch("src.core.task_manager.update_task_duration")
+    @patch("src.core.task_manager.get_task_duration", return_value=None)
+    @patch("src.core.task_manager.TaskManager.get_task_status")
+    async def test_wait_for_task_async_skips_failed_duration(
+        self, mock_get_status, mock_get_duration, mock_update
+    ):
+        """Failed runs should not feed the duration history."""
+        from src.models import TaskStatus
+
+        mock_get_status.return_value = TaskStatus(task_id="test", state=TaskState.FAILURE)
+
+        await TaskManager.wait_for_task_async("test", task_name="classify_image")
+
+        mock_update.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("src.core.task_manager.update_task_duration")
+    @patch("src.core.task_manager.get_task_duration")
+    @patch("src.core.task_manager.TaskManager.get_task_status")
+    async def test_wait_for_task_async_no_history_without_metrics(
+        self, mock_get_status, mock_get_duration, mock_update
+    ):
+        """Duration history should not be touched with metrics disabled."""
+        from src.models import TaskStatus
+
+        mock_get_status.return_value = TaskStatus(task_id="test", state=TaskState.SUCCESS)
+
+        with patch("src.core.task_manager.settings.enable_metrics", False):
+            await TaskManager.wait_for_task_async("test", task_name="classify_image")
+
+        mock_get_duration.assert_not_called()
+        mock_update.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("src.core.task_manager.TaskManager.get_task_status")
+    async def test_wait_for_task_async_timeout(self, mock_get_status):
+        """wait_for_task_async should timeout if task doesn't complete."""
+        from src.models import TaskStatus
+
+        mock_get_status.return_value = TaskStatus(
+            task_id="test",
+            state=TaskState.PENDING,
+        )
+
+        status = await TaskManager.wait_for_task_async(
+            "test", timeout=0.3, poll_interval=0.05
+        )
+
+        assert status.state == TaskState.TIMEOUT
+        assert "timeout" in status.error.lower()
+
+
 @pytest.mark.integration
 class TestCleanupTask:
     """Test task cleanup functionality."""
@@ -286,8 +691,11 @@ class TestCleanupTask:
 
     def test_cleanup_nonexistent_task(self, temp_storage):
         """cleanup_task should handle nonexistent task gracefully."""
-        # Should not raise error
-        TaskManager.cleanup_task("nonexistent-task")
+        # Should not raise error, nor create the directory on the way
+        with patch("pathlib.Path.mkdir") as mock_mkdir:
+            TaskManager.cleanup_task("nonexistent-task")
+
+        mock_mkdir.assert_not_called()
 
     def test_cleanup_task_with_multiple_files(self, temp_storage, task_id):
         """cleanup_task should remove all task files."""
@@ -362,7 +770,6 @@ class TestTaskManagerIntegration:
             parallel=True,
         )
 
-        # Track all tasks
-        for subtask_id in subtask_ids:
-            status = TaskManager.get_task_status(subtask_id)
-            assert status.task_id == subtask_id
\ No newline at end of file
+        # Track all tasks with one backend round-trip
+        statuses = TaskManager.get_task_statuses(subtask_ids)
+        assert [status.task_id for status in statuses] == subtask_ids
\ No newline at end of file
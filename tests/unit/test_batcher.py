@@ -0,0 +1,90 @@
+"""Unit tests for GPU request batching."""
+import json
+import pytest
+from unittest.mock import MagicMock, patch
+
+from celery import signature
+from src.core import batcher
+from src.core.config import settings
+
+
+@pytest.fixture
+def mock_redis_client():
+    """Redis client mock returned by the batcher."""
+    client = MagicMock()
+    with patch("src.core.batcher._redis_client", return_value=client):
+        yield client
+
+
+@pytest.mark.unit
+class TestSubmitGpuRequest:
+    """Test buffering of GPU requests."""
+
+    def test_pushes_request_to_model_list(self, mock_redis_client):
+        """Request should be appended to the model's Redis list."""
+        batcher.submit_gpu_request("portrait", "task-1", "/path/input.jpg")
+
+        key, raw = mock_redis_client.rpush.call_args.args
+        assert key == "gpu-batch:portrait"
+        assert json.loads(raw) == {
+            "task_id": "task-1",
+            "input_path": "/path/input.jpg",
+            "callback": None,
+        }
+
+    def test_serializes_callback_signature(self, mock_redis_client):
+        """Callback signature should be stored as a dict."""
+        callback = signature("encode_result", args=("task-1",))
+
+        batcher.submit_gpu_request("general", "task-1", "/in.jpg", callback=callback)
+
+        item = json.loads(mock_redis_client.rpush.call_args.args[1])
+        assert item["callback"]["task"] == "encode_result"
+
+    def test_unknown_model_raises_error(self, mock_redis_client):
+        """Models without a GPU queue should be rejected."""
+        with pytest.raises(ValueError, match="no GPU queue"):
+            batcher.submit_gpu_request("unknown", "task-1", "/in.jpg")
+
+
+@pytest.mark.unit
+class TestDispatchGpuBatches:
+    """Test the periodic batch dispatcher."""
+
+    def _items(self, n):
+        return [json.dumps({"task_id": f"t{i}", "input_path": f"/{i}.jpg"}) for i in range(n)]
+
+    def test_drains_up_to_max_batch(self, mock_redis_client, monkeypatch):
+        """Buffered requests should be split into batches of gpu_max_batch."""
+        monkeypatch.setattr(settings, "gpu_max_batch", 2)
+        buffers = {"gpu-batch:general": self._items(3)}
+
+        def execute():
+            key, start, end = pipe.lrange.call_args.args
+            items = buffers.get(key, [])
+            buffers[key] = items[end + 1:]
+            return [items[: end + 1], True]
+
+        pipe = mock_redis_client.pipeline.return_value
+        pipe.execute.side_effect = execute
+
+        with patch("src.core.batcher.celery_app.send_task") as mock_send:
+            batches = batcher.dispatch_gpu_batches()
+
+        assert batches == 2
+        sizes = [len(c.kwargs["args"][1]) for c in mock_send.call_args_list]
+        assert sizes == [2, 1]
+        assert all(
+            c.kwargs["queue"] == settings.queue_gpu_general
+            for c in mock_send.call_args_list
+        )
+
+    def test_no_requests_no_batches(self, mock_redis_client):
+        """Dispatcher should not submit anything when buffers are empty."""
+        mock_redis_client.pipeline.return_value.execute.return_value = [[], True]
+
+        with patch("src.core.batcher.celery_app.send_task") as mock_send:
+            batches = batcher.dispatch_gpu_batches()
+
+        assert batches == 0
+        mock_send.assert_not_called()
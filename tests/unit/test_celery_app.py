@@ -0,0 +1,71 @@
+"""Unit tests for Celery worker lifecycle hooks."""
+import pytest
+from types import SimpleNamespace
+
+from src.core.celery_app import celeryd_init_handler
+from src.core.config import settings
+
+
+@pytest.mark.unit
+class TestCeleryInitHandler:
+    """Test per-worker configuration on startup."""
+
+    def test_gpu_worker_children_not_recycled(self):
+        """Workers consuming a GPU queue should not recycle pool processes."""
+        conf = SimpleNamespace(worker_max_tasks_per_child=1000)
+
+        celeryd_init_handler(
+            conf=conf, options={"queues": [settings.queue_gpu_portrait]}
+        )
+
+        assert conf.worker_max_tasks_per_child is None
+
+    def test_comma_separated_queues(self):
+        """Queue lists given as a single string should be split."""
+        conf = SimpleNamespace(worker_max_tasks_per_child=1000)
+
+        celeryd_init_handler(
+            conf=conf,
+            options={"queues": f"{settings.queue_io},{settings.queue_gpu_general}"},
+        )
+
+        assert conf.worker_max_tasks_per_child is None
+
+    @pytest.mark.parametrize(
+        "options", [{"queues": [settings.queue_io, settings.queue_cpu]}, {}]
+    )
+    def test_other_workers_keep_limit(self, options):
+        """IO/CPU workers and workers without -Q should keep recycling."""
+        conf = SimpleNamespace(worker_max_tasks_per_child=1000)
+
+        celeryd_init_handler(conf=conf, options=options)
+
+        assert conf.worker_max_tasks_per_child == 1000
+
+
+@pytest.mark.unit
+class TestTestRedisDb:
+    """Test the test session's Redis isolation."""
+
+    def test_app_uses_per_worker_db(self):
+        """The real app should talk to the DB chosen for this test process."""
+        import os
+
+        from src.core.celery_app import celery_app
+
+        assert settings.redis_db == int(os.environ["REDIS_DB"])
+        assert celery_app.conf.broker_url.endswith(f"/{settings.redis_db}")
+
+
+@pytest.mark.unit
+class TestTaskRoutes:
+    """Test queue routing of framework tasks."""
+
+    def test_batch_dispatcher_has_own_queue(self):
+        """The batch dispatcher should not queue behind CPU work."""
+        from src.core.celery_app import celery_app
+
+        route = celery_app.amqp.router.route({}, "dispatch_gpu_batches")
+
+        assert route["queue"].name == settings.queue_gpu_dispatch
+        assert settings.queue_gpu_dispatch != settings.queue_cpu
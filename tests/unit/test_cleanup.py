@@ -0,0 +1,93 @@
+"""Unit tests for periodic shared storage cleanup."""
+import os
+import time
+import pytest
+from unittest.mock import patch
+
+from src.core.cleanup import (
+    CLEANUP_BATCH_SIZE,
+    cleanup_old_tasks,
+    cleanup_task_batch,
+    find_expired_entries,
+)
+
+
+def _age(path, seconds):
+    """Set mtime of a path to ``seconds`` in the past."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+@pytest.mark.unit
+class TestFindExpiredEntries:
+    """Test expired entry detection."""
+
+    def test_only_old_entries_returned(self, temp_storage):
+        """Entries modified within max_age should be kept."""
+        old_dir = temp_storage / "old-task"
+        new_dir = temp_storage / "new-task"
+        old_dir.mkdir()
+        new_dir.mkdir()
+        _age(old_dir, 1000)
+
+        expired = find_expired_entries(temp_storage, 600)
+
+        assert expired == [str(old_dir)]
+
+    def test_results_dir_skipped(self, temp_storage):
+        """Result blobs directory should not be swept with task dirs."""
+        results_dir = temp_storage / "results"
+        results_dir.mkdir()
+        _age(results_dir, 1000)
+
+        assert find_expired_entries(temp_storage, 600) == []
+
+    def test_missing_root(self, tmp_path):
+        """Missing directory should yield no entries."""
+        assert find_expired_entries(tmp_path / "missing", 600) == []
+
+
+@pytest.mark.unit
+class TestCleanupOldTasks:
+    """Test cleanup sweeper task."""
+
+    @patch("src.core.cleanup.cleanup_task_batch.apply_async")
+    def test_dispatches_batches(self, mock_apply, temp_storage):
+        """Expired entries should be dispatched in fixed-size batches."""
+        for i in range(CLEANUP_BATCH_SIZE + 1):
+            task_dir = temp_storage / f"task-{i}"
+            task_dir.mkdir()
+            _age(task_dir, 100000)
+
+        batches = cleanup_old_tasks()
+
+        assert batches == 2
+        sizes = [len(call.kwargs["args"][0]) for call in mock_apply.call_args_list]
+        assert sizes == [CLEANUP_BATCH_SIZE, 1]
+
+    @patch("src.core.cleanup.cleanup_task_batch.apply_async")
+    def test_nothing_expired(self, mock_apply, temp_storage):
+        """No batches should be dispatched when nothing expired."""
+        (temp_storage / "fresh-task").mkdir()
+
+        assert cleanup_old_tasks() == 0
+        mock_apply.assert_not_called()
+
+
+@pytest.mark.unit
+class TestCleanupTaskBatch:
+    """Test batch removal task."""
+
+    def test_removes_dirs_and_files(self, temp_storage):
+        """Both task directories and result blobs should be removed."""
+        task_dir = temp_storage / "task-1"
+        task_dir.mkdir()
+        (task_dir / "input.jpg").write_bytes(b"data")
+        blob = temp_storage / "result.bin"
+        blob.write_bytes(b"data")
+
+        count = cleanup_task_batch([str(task_dir), str(blob), str(temp_storage / "gone")])
+
+        assert count == 3
+        assert not task_dir.exists()
+        assert not blob.exists()
@@ -1,9 +1,9 @@
 """Unit tests for CPU worker tasks."""
 import pytest
-import json
+import orjson
 from pathlib import Path
 from PIL import Image
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 from src.workers.cpu_worker import (
     classify_image,
@@ -71,7 +71,7 @@ class TestClassifyImage:
         assert result_file.exists()
 
         # Verify content
-        saved_data = json.loads(result_file.read_text())
+        saved_data = orjson.loads(result_file.read_bytes())
         assert saved_data == result
 
     def test_classification_includes_dimensions(self, temp_storage, tmp_path, task_id):
@@ -121,6 +121,15 @@ class TestClassifyImage:
         with pytest.raises(Exception):
             classify_image(task_id, str(invalid_path))
 
+    def test_classification_does_not_decode_pixels(
+        self, temp_storage, sample_image, task_id
+    ):
+        """Classification should only read the image header."""
+        with patch("PIL.ImageFile.ImageFile.load") as mock_load:
+            classify_image(task_id, str(sample_image))
+
+        mock_load.assert_not_called()
+
     def test_classification_nonexistent_file_raises_error(self, temp_storage, task_id):
         """Classification should raise error for nonexistent file."""
         with pytest.raises(Exception):
@@ -133,7 +142,6 @@ class TestEncodeResult:
 
     def test_encode_result_creates_output(self, temp_storage, sample_image, task_id):
         """encode_result should create optimized output."""
-        from src.utils.storage import get_task_file_path
 
         result_path = encode_result(task_id, str(sample_image))
 
@@ -167,6 +175,16 @@ class TestEncodeResult:
         output_img = Image.open(result_path)
         assert output_img.format == "JPEG"
 
+    def test_encode_result_baseline_420(self, temp_storage, sample_image, task_id):
+        """encode_result should write baseline 4:2:0 JPEGs."""
+        from PIL import JpegImagePlugin
+
+        result_path = encode_result(task_id, str(sample_image))
+
+        with Image.open(result_path) as output_img:
+            assert JpegImagePlugin.get_sampling(output_img) == 2
+            assert "progressive" not in output_img.info
+
     def test_encode_result_preserves_dimensions(self, temp_storage, tmp_path, task_id):
         """encode_result should preserve image dimensions."""
         # Create test image with specific size
@@ -230,7 +248,7 @@ class TestCPUWorkerIntegration:
         assert result_file.exists()
 
         # 4. Verify classification data
-        saved_classification = json.loads(classification_file.read_text())
+        saved_classification = orjson.loads(classification_file.read_bytes())
         assert saved_classification["category"] == ImageCategory.PORTRAIT.value
 
 
@@ -0,0 +1,77 @@
+"""Unit tests for historical task duration tracking."""
+import pytest
+from unittest.mock import patch
+
+from src.core import durations
+from src.core.durations import (
+    EWMA_ALPHA,
+    get_task_duration,
+    update_task_duration,
+)
+
+
+@pytest.mark.unit
+class TestUpdateTaskDuration:
+    """Test EWMA updates."""
+
+    def setup_method(self):
+        """Clear in-process history."""
+        durations._task_duration_ewma.clear()
+
+    @patch("src.core.durations._redis_client", return_value=None)
+    def test_first_sample_seeds_ewma(self, mock_client):
+        """First duration should become the EWMA."""
+        assert update_task_duration("task", 2.0) == 2.0
+
+    @patch("src.core.durations._redis_client", return_value=None)
+    def test_ewma_weights_new_sample(self, mock_client):
+        """Later samples should be blended with EWMA_ALPHA."""
+        update_task_duration("task", 2.0)
+        ewma = update_task_duration("task", 4.0)
+
+        assert ewma == pytest.approx(EWMA_ALPHA * 4.0 + (1 - EWMA_ALPHA) * 2.0)
+
+    @patch("src.core.durations._redis_client")
+    def test_ewma_updated_atomically_in_redis(self, mock_client):
+        """The shared EWMA should be blended in Redis, not overwritten."""
+        mock_client.return_value.eval.return_value = b"1.25"
+
+        ewma = update_task_duration("classify_image", 1.5)
+
+        mock_client.return_value.set.assert_not_called()
+        args = mock_client.return_value.eval.call_args.args
+        assert args[1:] == (1, "task:ewma:classify_image", 1.5, EWMA_ALPHA)
+        assert ewma == 1.25
+        assert durations._task_duration_ewma["classify_image"] == 1.25
+
+    @patch("src.core.durations._redis_client")
+    def test_redis_errors_ignored(self, mock_client):
+        """Redis failures should not break task accounting."""
+        mock_client.return_value.eval.side_effect = ConnectionError("down")
+
+        assert update_task_duration("task", 1.0) == 1.0
+
+
+@pytest.mark.unit
+class TestGetTaskDuration:
+    """Test EWMA lookup."""
+
+    def setup_method(self):
+        """Clear in-process history."""
+        durations._task_duration_ewma.clear()
+
+    @patch("src.core.durations._redis_client")
+    def test_reads_shared_value(self, mock_client):
+        """Value stored in Redis should be returned."""
+        mock_client.return_value.get.return_value = b"0.75"
+
+        assert get_task_duration("task") == 0.75
+
+    @patch("src.core.durations._redis_client", return_value=None)
+    def test_falls_back_to_local_history(self, mock_client):
+        """Without Redis the in-process EWMA should be used."""
+        durations._task_duration_ewma["task"] = 3.0
+
+        assert get_task_duration("task") == 3.0
+        assert get_task_duration("other") is None
+
@@ -1,25 +1,56 @@
 """Unit tests for GPU worker tasks."""
 import pytest
 from pathlib import Path
+from types import SimpleNamespace
 from PIL import Image
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import patch
+from celery import chain, signature
+
+from src.core.celery_app import celery_app
 
 from src.workers.gpu_worker import (
+    MODEL_PATHS,
     ModelRegistry,
+    preload_models,
+    preload_models_handler,
+    preload_models_init_handler,
     run_inference,
+    run_inference_batch,
     gpu_inference_general,
     gpu_inference_portrait,
     gpu_inference_landscape,
+    gpu_inference_batch,
 )
 
 
+@pytest.fixture(scope="module")
+def model_entries():
+    """Registry entries for every model, loaded once per module."""
+    with patch.object(ModelRegistry, "_models", {}):
+        for name, path in MODEL_PATHS.items():
+            ModelRegistry.load_model(name, path)
+        return dict(ModelRegistry._models)
+
+
+@pytest.fixture
+def use_models(monkeypatch, model_entries):
+    """Install a private registry holding the named models for one test."""
+    def install(*names):
+        models = {name: model_entries[name] for name in names}
+        monkeypatch.setattr(ModelRegistry, "_models", models)
+        return models
+
+    return install
+
+
 @pytest.mark.unit
 class TestModelRegistry:
     """Test ModelRegistry singleton pattern."""
 
-    def setup_method(self):
-        """Clear registry before each test."""
-        ModelRegistry._models.clear()
+    @pytest.fixture(autouse=True)
+    def models(self, use_models):
+        """Use a fresh, empty registry."""
+        use_models()
 
     def test_load_model_once(self):
         """Model should be loaded only once."""
@@ -60,6 +91,15 @@ class TestModelRegistry:
         assert model["path"] == "/path/to/model.pth"
         assert model["loaded"] is True
 
+    @patch("src.workers.gpu_worker.settings")
+    def test_model_dtype_from_settings(self, mock_settings):
+        """Models should be registered with the configured precision."""
+        mock_settings.gpu_inference_dtype = "bfloat16"
+
+        model = ModelRegistry.load_model("bf16_model", "/path/to/model.pth")
+
+        assert model["dtype"] == "bfloat16"
+
     def test_load_model_idempotent(self):
         """Loading same model multiple times should be idempotent."""
         model1 = ModelRegistry.load_model("model", "/path")
@@ -70,16 +110,133 @@ class TestModelRegistry:
         assert len(ModelRegistry._models) == 1
 
 
+    def test_concurrent_loads_happen_once(self):
+        """Threads racing to load the same model should load it once."""
+        import threading
+        import time
+
+        def slow_dtype(*args):
+            time.sleep(0.05)
+            return "float16"
+
+        with patch("src.workers.gpu_worker.settings") as mock_settings, \
+                patch("src.workers.gpu_worker.logger") as mock_logger:
+            type(mock_settings).gpu_inference_dtype = property(slow_dtype)
+            threads = [
+                threading.Thread(
+                    target=ModelRegistry.load_model, args=("race", "/path")
+                )
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        loads = [
+            call for call in mock_logger.info.call_args_list
+            if call.args[0].startswith("Loading model")
+        ]
+        assert len(loads) == 1
+
+
+@pytest.mark.unit
+class TestCudaAllocatorConfig:
+    """Test CUDA allocator configuration."""
+
+    def test_alloc_conf_set_on_import(self):
+        """Importing the GPU worker should configure the CUDA allocator."""
+        import os
+
+        assert os.environ["PYTORCH_CUDA_ALLOC_CONF"]
+
+
+@pytest.mark.unit
+class TestPreloadModels:
+    """Test concurrent model preloading."""
+
+    @pytest.fixture(autouse=True)
+    def models(self, use_models):
+        """Use a fresh, empty registry."""
+        use_models()
+
+    def test_preloads_all_models(self):
+        """Every configured model should be registered."""
+        preload_models()
+
+        assert set(ModelRegistry._models) == set(MODEL_PATHS)
+
+    @patch.object(ModelRegistry, "load_model", side_effect=RuntimeError("no GPU"))
+    def test_load_errors_propagate(self, mock_load):
+        """A failed load in the pool should surface to the caller."""
+        with pytest.raises(RuntimeError, match="no GPU"):
+            preload_models()
+
+
+@pytest.mark.unit
+class TestPreloadModelsHandler:
+    """Test model preloading in worker pool processes."""
+
+    @patch("src.workers.gpu_worker.preload_models")
+    @patch("src.workers.gpu_worker.celery_app")
+    def test_gpu_worker_preloads(self, mock_app, mock_preload):
+        """Workers consuming a GPU queue should preload models."""
+        mock_app.amqp.queues.consume_from = {"gpu-general": None}
+
+        preload_models_handler()
+
+        mock_preload.assert_called_once()
+
+    @patch("src.workers.gpu_worker.preload_models")
+    @patch("src.workers.gpu_worker.celery_app")
+    def test_non_gpu_worker_skips(self, mock_app, mock_preload):
+        """IO and CPU workers should not load models."""
+        mock_app.amqp.queues.consume_from = {"io": None}
+
+        preload_models_handler()
+
+        mock_preload.assert_not_called()
+
+    @patch("src.workers.gpu_worker.preload_models", side_effect=RuntimeError("no GPU"))
+    @patch("src.workers.gpu_worker.celery_app")
+    def test_preload_failure_logged(self, mock_app, mock_preload):
+        """A failed preload should be logged, not crash the pool process."""
+        mock_app.amqp.queues.consume_from = {"gpu-general": None}
+
+        with patch("src.workers.gpu_worker.logger") as mock_logger:
+            preload_models_handler()
+
+        mock_logger.exception.assert_called_once()
+
+
+@pytest.mark.unit
+class TestPreloadModelsInitHandler:
+    """Test model preloading in the worker main process."""
+
+    @pytest.mark.parametrize("pool", ["threads", "solo"])
+    @patch("src.workers.gpu_worker.preload_models_handler")
+    def test_non_forking_pool_preloads(self, mock_handler, pool):
+        """Pools without forked children should preload on worker init."""
+        preload_models_init_handler(sender=SimpleNamespace(pool_cls=pool))
+
+        mock_handler.assert_called_once()
+
+    @patch("src.workers.gpu_worker.preload_models_handler")
+    def test_prefork_pool_waits_for_children(self, mock_handler):
+        """Prefork workers should leave the load to the forked children."""
+        preload_models_init_handler(sender=SimpleNamespace(pool_cls="prefork"))
+
+        mock_handler.assert_not_called()
+
+
 @pytest.mark.unit
 class TestRunInference:
     """Test GPU inference execution."""
 
-    def setup_method(self):
-        """Clear registry and set up test models."""
-        ModelRegistry._models.clear()
-        ModelRegistry.load_model("general", "/models/general_model.pth")
-        ModelRegistry.load_model("portrait", "/models/portrait_model.pth")
-        ModelRegistry.load_model("landscape", "/models/landscape_model.pth")
+    @pytest.fixture(autouse=True)
+    def models(self, use_models):
+        """Install all models."""
+        use_models("general", "portrait", "landscape")
 
     def test_inference_creates_output(self, tmp_path):
         """Inference should create output file."""
@@ -175,10 +332,10 @@ class TestRunInference:
 class TestGPUInferenceGeneral:
     """Test gpu_inference_general task."""
 
-    def setup_method(self):
-        """Set up test models."""
-        ModelRegistry._models.clear()
-        ModelRegistry.load_model("general", "/models/general_model.pth")
+    @pytest.fixture(autouse=True)
+    def models(self, use_models):
+        """Install test models."""
+        use_models("general")
 
     def test_inference_general_returns_output_path(self, temp_storage, sample_image, task_id):
         """gpu_inference_general should return output path."""
@@ -212,10 +369,10 @@ class TestGPUInferenceGeneral:
 class TestGPUInferencePortrait:
     """Test gpu_inference_portrait task."""
 
-    def setup_method(self):
-        """Set up test models."""
-        ModelRegistry._models.clear()
-        ModelRegistry.load_model("portrait", "/models/portrait_model.pth")
+    @pytest.fixture(autouse=True)
+    def models(self, use_models):
+        """Install test models."""
+        use_models("portrait")
 
     def test_inference_portrait_returns_output_path(
         self, temp_storage, portrait_image, task_id
@@ -239,10 +396,10 @@ class TestGPUInferencePortrait:
 class TestGPUInferenceLandscape:
     """Test gpu_inference_landscape task."""
 
-    def setup_method(self):
-        """Set up test models."""
-        ModelRegistry._models.clear()
-        ModelRegistry.load_model("landscape", "/models/landscape_model.pth")
+    @pytest.fixture(autouse=True)
+    def models(self, use_models):
+        """Install test models."""
+        use_models("landscape")
 
     def test_inference_landscape_returns_output_path(
         self, temp_storage, landscape_image, task_id
@@ -265,12 +422,10 @@ class TestGPUInferenceLandscape:
 class TestGPUWorkerIntegration:
     """Test GPU worker functions integration."""
 
-    def setup_method(self):
-        """Set up all models."""
-        ModelRegistry._models.clear()
-        ModelRegistry.load_model("general", "/models/general_model.pth")
-        ModelRegistry.load_model("portrait", "/models/portrait_model.pth")
-        ModelRegistry.load_model("landscape", "/models/landscape_model.pth")
+    @pytest.fixture(autouse=True)
+    def models(self, use_models):
+        """Install all models."""
+        use_models("general", "portrait", "landscape")
 
     def test_all_inference_tasks_work(self, temp_storage, sample_image, task_id):
         """All three inference tasks should work correctly."""
@@ -302,4 +457,125 @@ class TestGPUWorkerIntegration:
             gpu_inference_general(task_id, str(sample_image))
 
         # Model count should remain the same
-        assert len(ModelRegistry._models) == initial_model_count
\ No newline at end of file
+        assert len(ModelRegistry._models) == initial_model_count
+
+@pytest.mark.unit
+class TestGPUInferenceBatch:
+    """Test gpu_inference_batch task."""
+
+    @pytest.fixture(autouse=True)
+    def models(self, use_models):
+        """Install test models."""
+        use_models("general")
+
+    def test_batch_returns_output_per_request(self, temp_storage, sample_image):
+        """Each request should get its own output path, in order."""
+        requests = [
+            {"task_id": f"batch-{i}", "input_path": str(sample_image)}
+            for i in range(3)
+        ]
+
+        output_paths = gpu_inference_batch("general", requests)
+
+        assert len(output_paths) == 3
+        for i, output_path in enumerate(output_paths):
+            assert Path(output_path).exists()
+            assert Path(output_path).parent.name == f"batch-{i}"
+
+    def test_batch_isolates_failures(self, temp_storage, sample_image):
+        """A failing request should not fail the rest of the batch."""
+        requests = [
+            {"task_id": "bad", "input_path": "/nonexistent/input.jpg"},
+            {"task_id": "good", "input_path": str(sample_image)},
+        ]
+
+        output_paths = gpu_inference_batch("general", requests)
+
+        assert output_paths[0] is None
+        assert Path(output_paths[1]).exists()
+
+    def test_batch_applies_callback(self, temp_storage, sample_image):
+        """Callback signature should be applied with the output path."""
+        requests = [
+            {
+                "task_id": "cb-task",
+                "input_path": str(sample_image),
+                "callback": {"task": "encode_result", "args": [], "kwargs": {}},
+            }
+        ]
+
+        with patch("src.workers.gpu_worker.signature") as mock_signature:
+            output_paths = gpu_inference_batch("general", requests)
+
+        mock_signature.return_value.apply_async.assert_called_once_with(
+            args=(output_paths[0],)
+        )
+
+    def test_batch_fails_callback_chain(self, temp_storage):
+        """A failed request should fail the final task of its callback chain."""
+        callback = chain(
+            signature("super_resolution_encode_stage", task_id="encode-id"),
+            signature("super_resolution_finalize_stage", task_id="final-id"),
+        )
+        requests = [
+            {
+                "task_id": "bad",
+                "input_path": "/nonexistent/input.jpg",
+                "callback": dict(callback),
+            }
+        ]
+
+        with patch.object(celery_app.backend, "mark_as_failure") as mock_fail:
+            gpu_inference_batch("general", requests)
+
+        mock_fail.assert_called_once()
+        assert mock_fail.call_args.args[0] == "final-id"
+        assert isinstance(mock_fail.call_args.args[1], RuntimeError)
+
+    @patch("src.workers.gpu_worker.run_inference_batch", return_value=[True, True])
+    def test_batch_single_inference_call(self, mock_run_batch, temp_storage, sample_image):
+        """The whole batch should go through one inference call."""
+        requests = [
+            {"task_id": f"one-pass-{i}", "input_path": str(sample_image)}
+            for i in range(2)
+        ]
+
+        gpu_inference_batch("general", requests)
+
+        mock_run_batch.assert_called_once()
+        assert mock_run_batch.call_args.args[1] == [str(sample_image)] * 2
+
+
+@pytest.mark.unit
+class TestRunInferenceBatch:
+    """Test batched inference execution."""
+
+    @pytest.fixture(autouse=True)
+    def models(self, use_models):
+        """Install test models."""
+        use_models("general")
+
+    def test_outputs_aligned_with_inputs(self, tmp_path, sample_image):
+        """Each successful input should produce its 2x output."""
+        outputs = [str(tmp_path / "a.jpg"), str(tmp_path / "b.jpg")]
+
+        succeeded = run_inference_batch(
+            "general", [str(sample_image), "/nonexistent.jpg"], outputs
+        )
+
+        assert succeeded == [True, False]
+        with Image.open(sample_image) as src, Image.open(outputs[0]) as out:
+            assert out.size == (src.width * 2, src.height * 2)
+        assert not Path(outputs[1]).exists()
+
+    def test_closes_input_images(self, tmp_path, sample_image):
+        """Loaded input images should be closed once outputs are saved."""
+        with patch.object(Image.Image, "close", autospec=True) as mock_close:
+            run_inference_batch("general", [str(sample_image)], [str(tmp_path / "out.jpg")])
+
+        mock_close.assert_called_once()
+
+    def test_model_not_loaded(self, tmp_path):
+        """Unknown model should raise ValueError."""
+        with pytest.raises(ValueError, match="not loaded"):
+            run_inference_batch("missing", [], [])
@@ -0,0 +1,129 @@
+"""Unit tests for the shared HTTP client."""
+import pytest
+from unittest.mock import patch
+
+from src.utils import http
+
+
+@pytest.fixture(autouse=True)
+def fresh_client():
+    """Ensure each test starts without a cached client."""
+    http.reset_http_client()
+    yield
+    http.close_http_client()
+
+
+@pytest.mark.unit
+class TestSharedHttpClient:
+    """Test process-wide HTTP client lifecycle."""
+
+    def test_client_is_reused(self):
+        """Repeated calls should return the same pooled client."""
+        assert http.get_http_client() is http.get_http_client()
+
+    def test_close_discards_client(self):
+        """Closing should close the client and create a new one on next use."""
+        client = http.get_http_client()
+
+        http.close_http_client()
+
+        assert client.is_closed
+        assert http.get_http_client() is not client
+
+    def test_reset_does_not_close(self):
+        """Resetting after fork must leave the inherited client open."""
+        client = http.get_http_client()
+
+        http.reset_http_client()
+
+        assert not client.is_closed
+        assert http.get_http_client() is not client
+        client.close()
+
+
+@pytest.mark.unit
+class TestIoWorkerHttp:
+    """IO worker tasks should use the shared client."""
+
+    @patch("src.workers.io_worker.get_http_client")
+    def test_download_streams_to_disk(self, mock_get_client, mock_httpx_client, temp_storage):
+        """Download should stream chunks from the pooled client to disk."""
+        from src.workers.io_worker import download_image
+
+        response = mock_httpx_client.stream.return_value.__enter__.return_value
+        response.iter_bytes.return_value = [b"fake_", b"image_", b"data"]
+        mock_get_client.return_value = mock_httpx_client
+
+        path = download_image("task-1", "https://example.com/a.jpg")
+
+        mock_httpx_client.stream.assert_called_once_with(
+            "GET", "https://example.com/a.jpg", timeout=30.0
+        )
+        assert path.endswith("input.jpg")
+        assert open(path, "rb").read() == b"fake_image_data"
+
+    @patch("src.workers.io_worker.get_http_client")
+    def test_interrupted_download_leaves_no_input(
+        self, mock_get_client, mock_httpx_client, temp_storage
+    ):
+        """A download failing mid-stream should not leave a partial input.jpg."""
+        from celery.exceptions import Retry
+        from src.utils.storage import get_task_file_path
+        from src.workers.io_worker import download_image
+
+        def chunks(chunk_size):
+            yield b"partial_"
+            raise ConnectionError("reset")
+
+        response = mock_httpx_client.stream.return_value.__enter__.return_value
+        response.iter_bytes.side_effect = chunks
+        mock_get_client.return_value = mock_httpx_client
+
+        with pytest.raises((ConnectionError, Retry)):
+            download_image("task-1", "https://example.com/a.jpg")
+
+        file_path = get_task_file_path("task-1", "input.jpg")
+        assert not file_path.exists()
+        assert list(file_path.parent.iterdir()) == []
+
+    @patch("src.workers.io_worker.get_http_client")
+    def test_upload_streams_from_file(self, mock_get_client, mock_httpx_client, temp_storage):
+        """Upload should pass a file handle with an explicit length."""
+        from src.workers.io_worker import upload_result
+        from src.utils.storage import save_task_data
+
+        save_task_data("task-1", "result.jpg", b"result_bytes")
+        mock_get_client.return_value = mock_httpx_client
+
+        upload_result("task-1", "result.jpg", "https://example.com/upload")
+
+        kwargs = mock_httpx_client.put.call_args.kwargs
+        assert hasattr(kwargs["content"], "read")
+        assert kwargs["headers"]["Content-Length"] == str(len(b"result_bytes"))
+
+    @patch("src.workers.io_worker.os.posix_fadvise", create=True)
+    @patch("src.workers.io_worker.get_http_client")
+    def test_upload_drops_page_cache(self, mock_get_client, mock_fadvise, mock_httpx_client, temp_storage):
+        """Uploaded file pages should be released from the page cache."""
+        from src.workers.io_worker import upload_result
+        from src.utils.storage import save_task_data
+
+        save_task_data("task-1", "result.jpg", b"result_bytes")
+        mock_get_client.return_value = mock_httpx_client
+
+        upload_result("task-1", "result.jpg", "https://example.com/upload")
+
+        mock_fadvise.assert_called_once()
+
+    @patch("src.monitoring.notification.get_http_client")
+    def test_webhook_uses_shared_client(self, mock_get_client, mock_httpx_client):
+        """Webhook notifications should go through the pooled client."""
+        from src.monitoring.notification import _send_webhook
+
+        mock_get_client.return_value = mock_httpx_client
+
+        _send_webhook("https://example.com/hook", {"event": "test"})
+
+        mock_httpx_client.post.assert_called_once_with(
+            "https://example.com/hook", json={"event": "test"}, timeout=10.0
+        )
@@ -0,0 +1,26 @@
+"""Unit tests for import boundaries between API and worker code."""
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.unit
+class TestWorkerImports:
+    """Worker processes should not load the web stack."""
+
+    def test_worker_modules_do_not_import_fastapi(self):
+        """Importing Celery task modules should not pull in FastAPI."""
+        code = (
+            "import sys\n"
+            "from src.core.celery_app import celery_app\n"
+            "celery_app.loader.import_default_modules()\n"
+            "assert 'fastapi' not in sys.modules, 'fastapi imported'\n"
+            "assert 'src.monitoring.dashboard' not in sys.modules, 'dashboard imported'\n"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
+
+        assert result.returncode == 0, result.stderr
@@ -0,0 +1,80 @@
+"""Unit tests for task metrics collection."""
+import pytest
+from unittest.mock import patch
+
+from src.monitoring.metrics import task_metrics
+
+
+@pytest.mark.unit
+class TestTaskMetrics:
+    """Test task metrics collection."""
+
+    def test_completed_task_observed(self):
+        """Completed task should count and observe its duration."""
+        start_time = task_metrics.task_started()
+        task_metrics.task_completed(
+            "task-1", "gpu_inference_observed", success=True, start_time=start_time
+        )
+
+        labels = {"task_name": "gpu_inference_observed", "worker_type": "gpu"}
+        assert task_metrics.registry.get_sample_value(
+            "task_duration_seconds_count", labels
+        ) == 1
+        assert task_metrics.registry.get_sample_value(
+            "tasks_completed_total",
+            {"task_name": "gpu_inference_observed", "status": "success"},
+        ) == 1
+
+    def test_completion_without_start_not_timed(self):
+        """Completion of an untracked task should only bump counters."""
+        task_metrics.task_completed("unknown-task", "untimed_task", success=False)
+
+        assert task_metrics.registry.get_sample_value(
+            "task_duration_seconds_count",
+            {"task_name": "untimed_task", "worker_type": "unknown"},
+        ) is None
+        assert task_metrics.registry.get_sample_value(
+            "tasks_completed_total", {"task_name": "untimed_task", "status": "failure"}
+        ) == 1
+
+    def test_label_children_cached(self):
+        """Labelled children should be created once per label set."""
+        with patch.object(
+            task_metrics.tasks_timeout, "labels", wraps=task_metrics.tasks_timeout.labels
+        ) as mock_labels:
+            task_metrics.task_timeout("cached-task")
+            task_metrics.task_timeout("cached-task")
+
+        assert mock_labels.call_count == 1
+        sample = task_metrics.registry.get_sample_value(
+            "tasks_timeout_total", {"task_name": "cached-task"}
+        )
+        assert sample == 2
+
+    def test_duration_histogram_uses_configured_buckets(self):
+        """Duration histogram should expose only the configured buckets."""
+        from src.core.config import settings
+
+        task_metrics.task_completed(
+            "bucket-task", "classify_image", success=True,
+            start_time=task_metrics.task_started(),
+        )
+
+        bucket_bounds = [
+            sample.labels["le"]
+            for metric in task_metrics.registry.collect()
+            if metric.name == "task_duration_seconds"
+            for sample in metric.samples
+            if sample.name == "task_duration_seconds_bucket"
+            and sample.labels["task_name"] == "classify_image"
+        ]
+        assert len(bucket_bounds) == len(settings.prometheus_latency_buckets) + 1
+
+    def test_export_only_includes_own_registry(self):
+        """Export should contain task metrics but not global collectors."""
+        task_metrics.task_submitted("export-task")
+
+        exported = task_metrics.export_metrics().decode()
+
+        assert 'tasks_submitted_total{task_name="export-task"}' in exported
+        assert "python_gc_" not in exported
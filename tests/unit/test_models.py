@@ -1,6 +1,6 @@
 """Unit tests for task models."""
 import pytest
-from datetime import datetime
+from datetime import datetime, timezone
 from pydantic import ValidationError
 
 from src.models import (
@@ -82,7 +82,7 @@ class TestSubTaskConfig:
         assert config.worker_type == WorkerType.CPU
         assert config.queue == "cpu_queue"
         assert config.priority == TaskPriority.HIGH
-        assert config.args == []
+        assert config.args == ()
         assert config.kwargs == {}
         assert config.timeout is None
 
@@ -97,7 +97,7 @@ class TestSubTaskConfig:
             timeout=300,
         )
 
-        assert config.args == ["arg1", "arg2"]
+        assert config.args == ("arg1", "arg2")
         assert config.kwargs == {"key": "value"}
         assert config.timeout == 300
 
@@ -110,7 +110,7 @@ class TestSubTaskConfig:
         )
 
         assert config.priority == TaskPriority.NORMAL
-        assert config.args == []
+        assert config.args == ()
         assert config.kwargs == {}
         assert config.timeout is None
 
@@ -132,7 +132,7 @@ class TestTaskRequest:
         request = TaskRequest(task_name="classify_image")
 
         assert request.task_name == "classify_image"
-        assert request.args == []
+        assert request.args == ()
         assert request.kwargs == {}
         assert request.priority == TaskPriority.NORMAL
         assert request.sync is False
@@ -148,7 +148,7 @@ class TestTaskRequest:
         )
 
         assert request.task_name == "process_image"
-        assert request.args == ["task-id", "/path/to/image"]
+        assert request.args == ("task-id", "/path/to/image")
         assert request.kwargs == {"quality": 95}
         assert request.priority == TaskPriority.HIGH
         assert request.sync is True
@@ -157,7 +157,7 @@ class TestTaskRequest:
         """TaskRequest should apply correct defaults."""
         request = TaskRequest(task_name="test_task")
 
-        assert request.args == []
+        assert request.args == ()
         assert request.kwargs == {}
         assert request.priority == TaskPriority.NORMAL
         assert request.sync is False
@@ -167,6 +167,13 @@ class TestTaskRequest:
         with pytest.raises(ValidationError):
             TaskRequest()  # Missing task_name
 
+    def test_task_request_ignores_extra_fields(self):
+        """TaskRequest should accept and drop unknown fields from clients."""
+        request = TaskRequest(task_name="test_task", unknown_field=True)
+
+        assert request.task_name == "test_task"
+        assert not hasattr(request, "unknown_field")
+
 
 class TestTaskResponse:
     """Test TaskResponse model."""
@@ -200,6 +207,12 @@ class TestTaskResponse:
         time_diff = abs((response2.submitted_at - response1.submitted_at).total_seconds())
         assert time_diff < 1.0
 
+    def test_task_response_submitted_at_is_utc(self):
+        """Default submitted_at should be timezone-aware UTC."""
+        response = TaskResponse(task_id="task1", state=TaskState.PENDING)
+
+        assert response.submitted_at.tzinfo is timezone.utc
+
 
 class TestTaskStatus:
     """Test TaskStatus model."""
@@ -216,7 +229,7 @@ class TestTaskStatus:
         assert status.progress is None
         assert status.result is None
         assert status.error is None
-        assert status.subtasks == []
+        assert status.subtasks == ()
 
     def test_task_status_complete(self):
         """TaskStatus should accept all fields."""
@@ -241,7 +254,7 @@ class TestTaskStatus:
         assert status.submitted_at == submitted_at
         assert status.started_at == started_at
         assert status.completed_at == completed_at
-        assert status.subtasks == ["sub1", "sub2"]
+        assert status.subtasks == ("sub1", "sub2")
 
     def test_task_status_with_error(self):
         """TaskStatus should store error information."""
@@ -254,6 +267,27 @@ class TestTaskStatus:
         assert status.state == TaskState.FAILURE
         assert status.error == "Processing failed: Invalid input"
 
+    def test_task_status_is_frozen(self):
+        """TaskStatus should be immutable once created."""
+        status = TaskStatus(task_id="test-task", state=TaskState.PENDING)
+
+        with pytest.raises(ValidationError):
+            status.state = TaskState.SUCCESS
+
+    def test_task_status_model_copy_update(self):
+        """Updated statuses should be derived with model_copy."""
+        status = TaskStatus(task_id="test-task", state=TaskState.PENDING)
+
+        updated = status.model_copy(update={"state": TaskState.TIMEOUT})
+
+        assert updated.state == TaskState.TIMEOUT
+        assert status.state == TaskState.PENDING
+
+    def test_task_status_rejects_extra_fields(self):
+        """TaskStatus should reject unknown fields."""
+        with pytest.raises(ValidationError):
+            TaskStatus(task_id="test-task", state=TaskState.PENDING, unknown=1)
+
 
 class TestTaskMetrics:
     """Test TaskMetrics model."""
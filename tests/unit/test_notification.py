@@ -0,0 +1,116 @@
+"""Unit tests for admin notifications."""
+import pytest
+from unittest.mock import patch
+
+from src.monitoring import notification
+from src.monitoring.notification import (
+    notify_admin,
+    notify_admin_failure,
+    notify_admin_timeout,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_recent_alerts():
+    """Reset the dedup cache between tests."""
+    notification._recent_alerts.clear()
+    yield
+    notification._recent_alerts.clear()
+
+
+@pytest.fixture
+def webhook_configured(monkeypatch):
+    """Configure an admin webhook and email."""
+    from src.core.config import settings
+
+    monkeypatch.setattr(settings, "admin_webhook_url", "https://example.com/hook")
+    monkeypatch.setattr(settings, "admin_email", "admin@example.com")
+
+
+@pytest.mark.unit
+class TestNotifyAdmin:
+    """Test notification wrappers queue delivery."""
+
+    @patch("src.monitoring.notification.notify_admin.apply_async")
+    def test_timeout_is_queued(self, mock_apply, webhook_configured):
+        """Timeout alerts should be handed to the notify_admin task."""
+        notify_admin_timeout("task-1", 42.0)
+
+        payload, subject = mock_apply.call_args.kwargs["args"]
+        assert payload["event"] == "task_timeout"
+        assert payload["task_id"] == "task-1"
+        assert subject == "Task Timeout Alert: task-1"
+
+    @patch("src.monitoring.notification.notify_admin.apply_async")
+    def test_failure_has_no_email(self, mock_apply, webhook_configured):
+        """Failure alerts should only go to the webhook."""
+        notify_admin_failure("task-1", "boom")
+
+        payload, subject = mock_apply.call_args.kwargs["args"]
+        assert payload["event"] == "task_failure"
+        assert subject is None
+
+    @patch("src.monitoring.notification.notify_admin.apply_async")
+    def test_duplicates_coalesced(self, mock_apply, webhook_configured):
+        """Repeated alerts for the same task and event should be sent once."""
+        notify_admin_timeout("task-1", 31.0)
+        notify_admin_timeout("task-1", 32.0)
+        notify_admin_timeout("task-2", 31.0)
+
+        assert mock_apply.call_count == 2
+
+    @patch("src.monitoring.notification.notify_admin.apply_async")
+    def test_nothing_queued_without_targets(self, mock_apply, monkeypatch):
+        """No task should be queued when no target is configured."""
+        from src.core.config import settings
+
+        monkeypatch.setattr(settings, "admin_webhook_url", None)
+        monkeypatch.setattr(settings, "admin_email", None)
+
+        notify_admin_timeout("task-1", 42.0)
+
+        mock_apply.assert_not_called()
+
+    @patch("src.monitoring.notification.notify_admin.apply_async",
+           side_effect=ConnectionError("broker down"))
+    def test_queue_errors_swallowed(self, mock_apply, webhook_configured):
+        """Broker errors should not propagate to the caller."""
+        notify_admin_timeout("task-1", 42.0)
+
+
+@pytest.mark.unit
+class TestNotifyAdminTask:
+    """Test notification delivery task."""
+
+    @patch("src.monitoring.notification._send_email")
+    @patch("src.monitoring.notification._send_webhook")
+    def test_sends_webhook_and_email(self, mock_webhook, mock_email, webhook_configured):
+        """Both targets should be notified when a subject is given."""
+        payload = {"event": "task_timeout", "task_id": "t", "message": "msg"}
+
+        notify_admin(payload, "Subject")
+
+        mock_webhook.assert_called_once_with(url="https://example.com/hook", payload=payload)
+        mock_email.assert_called_once_with(to="admin@example.com", subject="Subject", body="msg")
+
+    @patch("src.monitoring.notification._send_email")
+    @patch("src.monitoring.notification._send_webhook", side_effect=RuntimeError("down"))
+    def test_webhook_failure_does_not_block_email(self, mock_webhook, mock_email, webhook_configured):
+        """A failing webhook should not prevent the email."""
+        notify_admin({"event": "e", "task_id": "t", "message": "msg"}, "Subject")
+
+        mock_email.assert_called_once()
+
+
+@pytest.mark.unit
+class TestNotifyAdminRouting:
+    """Test notification queue routing."""
+
+    def test_routed_to_notifications_queue(self):
+        """Admin alerts should not queue behind IO transfers."""
+        from src.core.celery_app import celery_app
+        from src.core.config import settings
+
+        route = celery_app.amqp.router.route({}, "notify_admin")
+
+        assert route["queue"].name == settings.queue_notifications
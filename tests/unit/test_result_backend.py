@@ -0,0 +1,104 @@
+"""Unit tests for the shared-storage result backend."""
+import pytest
+from unittest.mock import MagicMock, patch
+
+from celery.backends.redis import RedisBackend
+from celery.result import AsyncResult
+
+from src.core.celery_app import celery_app
+from src.core.config import settings
+from src.core.result_backend import SharedStorageRedisBackend, get_result_blob_path
+
+
+@pytest.fixture
+def backend():
+    """Backend instance (no Redis connection is made)."""
+    return SharedStorageRedisBackend(app=celery_app, url="redis://localhost:6379/1")
+
+
+@pytest.mark.unit
+class TestSharedStorageRedisBackend:
+    """Test out-of-band result storage."""
+
+    @patch.object(RedisBackend, "_store_result")
+    def test_small_result_stored_inline(self, mock_store, backend, temp_storage):
+        """Results under the threshold should go to Redis unchanged."""
+        backend.store_result("small-task", {"output": "ok"}, "SUCCESS")
+
+        assert mock_store.call_args[0][1] == {"output": "ok"}
+        assert not get_result_blob_path("small-task").exists()
+
+    @patch.object(RedisBackend, "_store_result")
+    def test_large_result_stored_as_ref(
+        self, mock_store, backend, temp_storage, monkeypatch
+    ):
+        """Results over the threshold should be written to shared storage."""
+        monkeypatch.setattr(settings, "result_inline_threshold", 16)
+        result = {"output": "x" * 100}
+
+        backend.store_result("large-task", result, "SUCCESS")
+
+        blob_path = get_result_blob_path("large-task")
+        assert mock_store.call_args[0][1] == {"__ref__": str(blob_path)}
+        assert backend.decode(blob_path.read_bytes()) == result
+
+    @patch.object(RedisBackend, "_store_result")
+    def test_failure_not_offloaded(
+        self, mock_store, backend, temp_storage, monkeypatch
+    ):
+        """Only successful results should be offloaded."""
+        monkeypatch.setattr(settings, "result_inline_threshold", 16)
+        error = ValueError("x" * 100)
+
+        backend.store_result("failed-task", error, "FAILURE")
+
+        assert mock_store.call_args[0][1]["exc_type"] == "ValueError"
+        assert not get_result_blob_path("failed-task").exists()
+
+    def test_ref_resolved_on_decode(self, backend, temp_storage):
+        """Stored refs should be resolved back to the original result."""
+        result = {"output": "x" * 100}
+        blob_path = get_result_blob_path("ref-task")
+        blob_path.parent.mkdir(parents=True)
+        blob_path.write_bytes(backend.encode(result))
+
+        meta = backend.meta_from_decoded(
+            {"status": "SUCCESS", "result": {"__ref__": str(blob_path)}}
+        )
+
+        assert meta["result"] == result
+
+    def test_missing_ref_reads_as_failure(self, backend, temp_storage):
+        """A ref to a missing blob should surface as a failed task."""
+        blob_path = get_result_blob_path("gone-task")
+
+        meta = backend.meta_from_decoded(
+            {
+                "task_id": "gone-task",
+                "status": "SUCCESS",
+                "result": {"__ref__": str(blob_path)},
+            }
+        )
+
+        assert meta["status"] == "FAILURE"
+        assert isinstance(meta["result"], FileNotFoundError)
+        assert str(blob_path) in str(meta["result"])
+
+    def test_pending_many_reads_back(self, backend):
+        """Metas written by store_pending_many should read back via AsyncResult."""
+        store = {}
+        client = MagicMock()
+        client.get.side_effect = store.get
+        pipe = client.pipeline.return_value.__enter__.return_value
+        pipe.set.side_effect = lambda key, value: store.__setitem__(key, value)
+        pipe.setex.side_effect = lambda key, ttl, value: store.__setitem__(key, value)
+
+        with patch.object(backend, "client", client):
+            backend.store_pending_many(["p-1", "p-2"], {"submitted_at": 123.0})
+
+            for task_id in ("p-1", "p-2"):
+                result = AsyncResult(task_id, backend=backend, app=celery_app)
+                assert result.state == "PENDING"
+                assert result.info == {"submitted_at": 123.0}
+
+        pipe.execute.assert_called_once()
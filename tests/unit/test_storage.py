@@ -1,8 +1,10 @@
 """Unit tests for storage utilities."""
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 
 from src.utils.storage import (
+    atomic_task_file,
     get_task_dir,
     get_task_file_path,
     save_task_data,
@@ -42,6 +44,35 @@ class TestGetTaskDir:
         assert task1_dir.exists()
         assert task2_dir.exists()
 
+    def test_mkdir_runs_once_per_task(self, temp_storage, task_id):
+        """Repeated calls should not hit the filesystem again."""
+        get_task_dir(task_id)
+
+        with patch.object(Path, "mkdir") as mock_mkdir:
+            get_task_dir(task_id)
+            get_task_file_path(task_id, "input.jpg")
+
+        mock_mkdir.assert_not_called()
+
+    def test_write_recreates_removed_directory(self, temp_storage, task_id):
+        """A write should recreate a cached directory removed since."""
+        task_dir = get_task_dir(task_id)
+        cleanup_task_dir(task_dir)
+
+        save_task_data(task_id, "data.bin", b"data")
+
+        assert (task_dir / "data.bin").read_bytes() == b"data"
+
+    def test_cleanup_keeps_other_cached_directories(self, temp_storage, task_id):
+        """Cleaning up one task should not drop other tasks' cached directories."""
+        get_task_dir("other-task")
+        cleanup_task_dir(get_task_dir(task_id))
+
+        with patch.object(Path, "mkdir") as mock_mkdir:
+            get_task_dir("other-task")
+
+        mock_mkdir.assert_not_called()
+
 
 @pytest.mark.unit
 class TestGetTaskFilePath:
@@ -87,6 +118,7 @@ class TestSaveTaskData:
         file_path = get_task_file_path(task_id, filename)
         assert file_path.exists()
         assert file_path.read_bytes() == data
+        assert [p.name for p in file_path.parent.iterdir()] == [filename]
 
     def test_overwrites_existing_file(self, temp_storage, task_id):
         """save_task_data should overwrite existing file."""
@@ -101,6 +133,30 @@ class TestSaveTaskData:
         file_path = get_task_file_path(task_id, filename)
         assert file_path.read_bytes() == b"updated"
 
+    def test_write_is_atomic(self, temp_storage, task_id):
+        """A failed write should leave the previous file intact."""
+        save_task_data(task_id, "test.txt", b"original")
+
+        with patch("src.utils.storage.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                save_task_data(task_id, "test.txt", b"updated")
+
+        file_path = get_task_file_path(task_id, "test.txt")
+        assert file_path.read_bytes() == b"original"
+        assert [p.name for p in file_path.parent.iterdir()] == ["test.txt"]
+
+    def test_concurrent_writers_use_separate_temp_files(self, temp_storage, task_id):
+        """Writers of the same file should never share a temporary file."""
+        file_path = get_task_file_path(task_id, "test.txt")
+
+        with atomic_task_file(file_path) as first, atomic_task_file(file_path) as second:
+            assert first.name != second.name
+            first.write(b"first")
+            second.write(b"second")
+
+        assert file_path.read_bytes() in (b"first", b"second")
+        assert [p.name for p in file_path.parent.iterdir()] == ["test.txt"]
+
     def test_saves_binary_data(self, temp_storage, task_id):
         """save_task_data should handle binary data correctly."""
         filename = "image.jpg"
@@ -179,6 +235,20 @@ class TestCleanupTaskDir:
         assert not task_dir.exists()
 
 
+    def test_does_not_follow_symlinks(self, temp_storage, task_id, tmp_path):
+        """Symlinked entries should be unlinked, not their targets removed."""
+        target_dir = tmp_path / "outside"
+        target_dir.mkdir()
+        (target_dir / "keep.txt").write_bytes(b"keep")
+        task_dir = get_task_dir(task_id)
+        (task_dir / "link").symlink_to(target_dir)
+
+        cleanup_task_dir(task_dir)
+
+        assert not task_dir.exists()
+        assert (target_dir / "keep.txt").exists()
+
+
 @pytest.mark.unit
 class TestStorageIntegration:
     """Test storage functions working together."""